@@ -1,11 +1,16 @@
 """AI agents for intelligent matching, scheduling, pricing, and recommendations."""
 from .base import BaseAgent
-from .matching_agent import MatchingAgent
-from .scheduling_agent import SchedulingAgent
-from .pricing_agent import PricingAgent
-from .review_agent import ReviewAnalysisAgent
-from .recommendation_agent import RecommendationAgent
-from .chat_agent import CustomerChatAgent, ProviderChatAgent
+from .matching_agent import MatchingAgent, get_matching_agent
+from .scheduling_agent import SchedulingAgent, get_scheduling_agent
+from .pricing_agent import PricingAgent, get_pricing_agent
+from .review_agent import ReviewAnalysisAgent, get_review_agent
+from .recommendation_agent import RecommendationAgent, get_recommendation_agent
+from .chat_agent import (
+    CustomerChatAgent,
+    ProviderChatAgent,
+    get_customer_chat_agent,
+    get_provider_chat_agent,
+)
 
 __all__ = [
     "BaseAgent",
@@ -16,5 +21,11 @@ __all__ = [
     "RecommendationAgent",
     "CustomerChatAgent",
     "ProviderChatAgent",
+    "get_matching_agent",
+    "get_scheduling_agent",
+    "get_pricing_agent",
+    "get_review_agent",
+    "get_recommendation_agent",
+    "get_customer_chat_agent",
+    "get_provider_chat_agent",
 ]
-
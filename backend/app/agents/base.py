@@ -1,36 +1,167 @@
 """Base agent class using OpenAI Agents SDK."""
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
-from agents import Agent, Runner
-from datetime import datetime
-import json
+from typing import Dict, Any, Optional, List, Tuple, Union
+from agents import Agent, Runner, ModelSettings, OpenAIChatCompletionsModel
+from openai import AsyncOpenAI
+import asyncio
+import hashlib
+import httpx
+import orjson
+import structlog
+import time
+from uuid import UUID
 
 from app.core.config import settings
-from app.core.prompt_cache import get_prompt_cache
+from app.core.prompt_cache import get_prompt_cache, get_semantic_cache
 from app.core.retry import retry_with_backoff, CircuitBreaker
+from app.db.client import AsyncSessionLocal
 from app.db.models import AgentExecutionLog
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+logger = structlog.get_logger()
+
+# Static lead-in for every user message; keep it free of per-request data so the
+# prompt prefix stays identical across calls.
+USER_MESSAGE_PREAMBLE = "Please analyze the following context and provide your response."
+
+# Window and size limit for coalescing concurrent calls into one model run
+BATCH_WINDOW_SECONDS = 0.25
+BATCH_MAX_SIZE = 8
+
+# Execution logs are queued and written in batches off the request path
+LOG_BATCH_SIZE = 100
+LOG_FLUSH_INTERVAL_SECONDS = 2.0
+_log_queue: asyncio.Queue = asyncio.Queue(maxsize=10000)
+_log_flusher_task: Optional[asyncio.Task] = None
+
+# One pooled OpenAI client and chat model, shared by every agent instance
+_client: Optional[AsyncOpenAI] = None
+_model: Optional[OpenAIChatCompletionsModel] = None
+
+
+def _get_client() -> AsyncOpenAI:
+    """Get the shared OpenAI client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+            )
+        )
+    return _client
+
+
+def _get_model() -> OpenAIChatCompletionsModel:
+    """Get the shared chat completions model bound to the pooled OpenAI client."""
+    global _model
+    if _model is None:
+        _model = OpenAIChatCompletionsModel(
+            model=settings.OPENAI_MODEL,
+            openai_client=_get_client()
+        )
+    return _model
+
+
+async def close_clients():
+    """Close the shared model client and its connection pool."""
+    global _client, _model
+    _model = None
+    client, _client = _client, None
+    if client is not None:
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning("Failed to close model client", error=str(e))
+
+
+async def _write_logs(rows: List[Dict[str, Any]]):
+    """Insert a batch of execution log rows in a single statement."""
+    try:
+        async with AsyncSessionLocal() as session:
+            await session.execute(insert(AgentExecutionLog), rows)
+            await session.commit()
+    except Exception as e:
+        logger.warning("Failed to write agent execution logs", count=len(rows), error=str(e))
+
+
+async def _log_flusher():
+    """Drain the log queue, writing up to LOG_BATCH_SIZE rows per flush interval."""
+    loop = asyncio.get_running_loop()
+    while True:
+        rows = [await _log_queue.get()]
+        deadline = loop.time() + LOG_FLUSH_INTERVAL_SECONDS
+        while len(rows) < LOG_BATCH_SIZE:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                rows.append(await asyncio.wait_for(_log_queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        await _write_logs(rows)
+
+
+def start_log_flusher():
+    """Start the background task that persists agent execution logs."""
+    global _log_flusher_task
+    if _log_flusher_task is None:
+        _log_flusher_task = asyncio.create_task(_log_flusher())
+
+
+async def stop_log_flusher():
+    """Stop the log flusher and write any logs still queued."""
+    global _log_flusher_task
+    if _log_flusher_task is not None:
+        _log_flusher_task.cancel()
+        _log_flusher_task = None
+    
+    rows = []
+    while not _log_queue.empty():
+        rows.append(_log_queue.get_nowait())
+    for i in range(0, len(rows), LOG_BATCH_SIZE):
+        await _write_logs(rows[i:i + LOG_BATCH_SIZE])
+
 
 class BaseAgent(ABC):
     """Base class for all AI agents using OpenAI Agents SDK."""
     
+    # Request JSON mode so responses are always a parseable JSON object
+    expects_json: bool = False
+    
+    # Reuse responses for near-identical contexts (only for near-deterministic outputs)
+    use_semantic_cache: bool = False
+    
     def __init__(self, agent_name: str, instructions: str, handoffs: Optional[List[str]] = None):
         self.agent_name = agent_name
         self.instructions = instructions
+        # Digest of the static instructions, used in cache keys instead of the full text
+        self.instructions_hash = hashlib.blake2b(instructions.encode(), digest_size=16).hexdigest()
         self.handoffs = handoffs or []
+        self.client = _get_client()
         self.prompt_cache = get_prompt_cache()
+        self.semantic_cache = get_semantic_cache()
         self.circuit_breaker = CircuitBreaker(
             failure_threshold=5,
             timeout=60.0
         )
         
+        # Batching state is created lazily inside the running event loop
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+        self._batch_flushes: set = set()
+        
         # Create OpenAI Agent
         self.agent = Agent(
             name=agent_name,
             instructions=instructions,
             handoff_description=self.get_handoff_description(),
-            handoffs=self.handoffs
+            handoffs=self.handoffs,
+            model=_get_model(),
+            model_settings=ModelSettings(
+                extra_body={"response_format": {"type": "json_object"}} if self.expects_json else None
+            )
         )
     
     @abstractmethod
@@ -44,18 +175,72 @@ class BaseAgent(ABC):
         pass
     
     def _build_user_message(self, context: Dict[str, Any]) -> str:
-        """Build user message from context."""
-        return f"Context:\n{json.dumps(context, indent=2)}\n\nPlease analyze and provide your response."
+        """
+        Build user message from context.
+        
+        The static request text comes first and the context is serialized
+        canonically (sorted keys, compact separators) so that identical
+        contexts always produce byte-identical prompts.
+        """
+        context_json = orjson.dumps(context, default=str, option=orjson.OPT_SORT_KEYS).decode()
+        return f"{USER_MESSAGE_PREAMBLE}\n\nContext:\n{context_json}"
+    
+    def _build_input(self, context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Build the input messages for an agent run.
+        
+        Prior conversation turns are sent as their own messages ahead of the
+        current request so the history forms a stable prefix that OpenAI's
+        automatic prompt caching can reuse.
+        """
+        history = context.get("conversation_history") or []
+        if history:
+            context = {k: v for k, v in context.items() if k != "conversation_history"}
+        
+        messages = [{"role": turn["role"], "content": turn["content"]} for turn in history]
+        messages.append({"role": "user", "content": self._build_user_message(context)})
+        return messages
     
     def _parse_response(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Parse agent response."""
         try:
             # Try to parse as JSON
-            return json.loads(content)
-        except json.JSONDecodeError:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
             # If not JSON, return as text
             return {"response": content, "raw": True}
     
+    def _answer_without_llm(self, context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return a response computed without the model when the context allows it, else None."""
+        return None
+    
+    @staticmethod
+    def _extract_json(content: str) -> Any:
+        """
+        Decode the JSON object in a response, ignoring any surrounding prose.
+        
+        Agents with expects_json set get a bare JSON object back, so the direct
+        decode succeeds and the scan for an embedded object never runs.
+        
+        Raises:
+            ValueError: If the content holds no decodable JSON object
+        """
+        # Clean JSON is the common case
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+        
+        # Decode the outermost braces straight from the encoded bytes, without
+        # copying the span into a new string first
+        data = content.encode()
+        start = data.find(b"{")
+        end = data.rfind(b"}")
+        if start < 0 or end < start:
+            raise ValueError("No JSON object in response")
+        
+        return orjson.loads(memoryview(data)[start:end + 1])
+    
     async def execute(
         self,
         context: Dict[str, Any],
@@ -77,33 +262,54 @@ class BaseAgent(ABC):
         Returns:
             Agent response
         """
-        user_message = self._build_user_message(context)
+        # Contexts a deterministic program can answer never reach the model
+        program_response = self._answer_without_llm(context)
+        if program_response is not None:
+            return program_response
         
         # Check cache
+        embedding = None
         if use_cache:
             cached_response = await self.prompt_cache.get(
                 self.agent_name,
-                self.instructions,
+                self.instructions_hash,
                 context
             )
             if cached_response:
                 return cached_response
+            
+            # Fall back to a similar earlier request from the same user
+            if settings.SEMANTIC_CACHE_ENABLED and self.use_semantic_cache:
+                embedding = await self._embed_context(context)
+                if embedding is not None:
+                    cached_response = await self.semantic_cache.get(
+                        self.agent_name,
+                        embedding,
+                        scope=context.get("user_id")
+                    )
+                    if cached_response:
+                        return cached_response
         
-        start_time = datetime.utcnow()
+        start_ns = time.monotonic_ns()
         execution_context = context.get("execution_context", "general")
         
+        # Stateless calls may share a model run with concurrent requests
+        batched = settings.AI_BATCH_ENABLED and session_id is None
+        
         try:
             # Execute with retry and circuit breaker
             async def execute_with_retry():
+                if batched:
+                    return await self._run_batched(self._build_user_message(context))
                 return await retry_with_backoff(
                     self._run_agent,
-                    user_message=user_message,
+                    user_input=self._build_input(context),
                     session_id=session_id or f"session_{booking_id or 'default'}"
                 )
             
             response_text = await self.circuit_breaker.call_async(execute_with_retry)
             
-            execution_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+            execution_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
             
             # Parse response
             response = self._parse_response(response_text, context)
@@ -112,15 +318,21 @@ class BaseAgent(ABC):
             if use_cache:
                 await self.prompt_cache.set(
                     self.agent_name,
-                    self.instructions,
+                    self.instructions_hash,
                     context,
                     response
                 )
+                if embedding is not None:
+                    await self.semantic_cache.set(
+                        self.agent_name,
+                        embedding,
+                        response,
+                        scope=context.get("user_id")
+                    )
             
             # Log execution
             if db:
-                await self._log_execution(
-                    db,
+                self._log_execution(
                     execution_context,
                     context,
                     response,
@@ -132,12 +344,11 @@ class BaseAgent(ABC):
             return response
             
         except Exception as e:
-            execution_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+            execution_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
             
             # Log failure
             if db:
-                await self._log_execution(
-                    db,
+                self._log_execution(
                     execution_context,
                     context,
                     None,
@@ -150,15 +361,25 @@ class BaseAgent(ABC):
             # Return fallback response
             return self._get_fallback_response(context, str(e))
     
-    async def _run_agent(self, user_message: str, session_id: str) -> str:
+    async def _embed_context(self, context: Dict[str, Any]) -> Optional[List[float]]:
+        """Embed the user message for semantic cache lookups, or None if embedding fails."""
+        try:
+            response = await self.client.embeddings.create(
+                model=settings.OPENAI_EMBEDDING_MODEL,
+                input=self._build_user_message(context),
+                dimensions=self.semantic_cache.dimensions
+            )
+        except Exception:
+            return None
+        return response.data[0].embedding
+    
+    async def _run_agent(self, user_input: Union[str, List[Dict[str, Any]]], session_id: str) -> str:
         """Run the agent using OpenAI Agents SDK Runner."""
         # Use Runner.run() - it's async and returns a result
         # According to SDK docs: result = await Runner.run(agent, message)
         result = await Runner.run(
             self.agent,
-            user_message,
-            model=settings.OPENAI_MODEL,
-            api_key=settings.OPENAI_API_KEY,
+            user_input,
             session_id=session_id
         )
         
@@ -175,9 +396,92 @@ class BaseAgent(ABC):
         else:
             return str(result)
     
-    async def _log_execution(
+    async def _run_batched(self, user_message: str) -> str:
+        """Queue a request for the next batched model run and wait for its share of the output."""
+        if self._batch_queue is None:
+            self._batch_queue = asyncio.Queue()
+            self._batch_task = asyncio.create_task(self._batch_worker())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._batch_queue.put((user_message, future))
+        return await future
+    
+    async def _batch_worker(self):
+        """Collect queued requests for up to the batch window and dispatch them together."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + BATCH_WINDOW_SECONDS
+            while len(batch) < BATCH_MAX_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._batch_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Run the batch in its own task so the next window can start collecting
+            task = asyncio.create_task(self._flush_batch(batch))
+            self._batch_flushes.add(task)
+            task.add_done_callback(self._batch_flushes.discard)
+    
+    async def _flush_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        """Run a batch of queued requests and resolve each caller's future."""
+        try:
+            outputs = await self._run_combined([message for message, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), output in zip(batch, outputs):
+            if not future.done():
+                future.set_result(output)
+    
+    async def _run_combined(self, user_messages: List[str]) -> List[str]:
+        """
+        Answer several independent requests with a single model run.
+        
+        Args:
+            user_messages: User messages, one per request
+        
+        Returns:
+            Raw output for each request, in the same order
+        """
+        session_id = f"batch_{self.agent_name}"
+        if len(user_messages) == 1:
+            output = await retry_with_backoff(
+                self._run_agent,
+                user_input=user_messages[0],
+                session_id=session_id
+            )
+            return [output]
+        
+        sections = "\n\n".join(
+            f"### Request {i}\n{message}" for i, message in enumerate(user_messages, 1)
+        )
+        prompt = (
+            f"Answer each of the following {len(user_messages)} requests independently. "
+            'Return a JSON object of the form {"responses": [...]} with exactly one entry '
+            "per request, in order, each following the response format from your instructions."
+            f"\n\n{sections}"
+        )
+        content = await retry_with_backoff(
+            self._run_agent,
+            user_input=prompt,
+            session_id=session_id
+        )
+        
+        responses = self._extract_json(content)["responses"]
+        if not isinstance(responses, list) or len(responses) != len(user_messages):
+            raise ValueError(f"Batched response has {len(responses)} entries for {len(user_messages)} requests")
+        
+        return [r if isinstance(r, str) else orjson.dumps(r).decode() for r in responses]
+    
+    def _log_execution(
         self,
-        db: AsyncSession,
         execution_context: str,
         input_data: Dict[str, Any],
         output_data: Optional[Dict[str, Any]],
@@ -186,17 +490,17 @@ class BaseAgent(ABC):
         error_message: Optional[str] = None,
         booking_id: Optional[str] = None
     ):
-        """Log agent execution to database."""
-        from uuid import UUID
-        log = AgentExecutionLog(
-            agent_name=self.agent_name,
-            execution_context=execution_context,
-            input_data=input_data,
-            output_data=output_data,
-            execution_time_ms=execution_time_ms,
-            success=success,
-            error_message=error_message,
-            booking_id=UUID(booking_id) if booking_id else None
-        )
-        db.add(log)
-        await db.flush()
+        """Queue agent execution log for the background flusher without blocking the caller."""
+        try:
+            _log_queue.put_nowait({
+                "agent_name": self.agent_name,
+                "execution_context": execution_context,
+                "input_data": input_data,
+                "output_data": output_data,
+                "execution_time_ms": execution_time_ms,
+                "success": success,
+                "error_message": error_message,
+                "booking_id": UUID(booking_id) if booking_id else None
+            })
+        except asyncio.QueueFull:
+            logger.warning("Agent execution log queue full, dropping entry", agent=self.agent_name)
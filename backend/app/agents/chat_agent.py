@@ -5,11 +5,7 @@ import json
 from app.agents.base import BaseAgent
 
 
-class CustomerChatAgent(BaseAgent):
-    """Chat agent for customer portal - helps customers with bookings, providers, and support."""
-    
-    def __init__(self):
-        instructions = """You are Karigar Assistant, a helpful AI assistant for the Karigar hyperlocal services marketplace. You help customers find service providers, manage bookings, and answer questions.
+_CUSTOMER_CHAT_INSTRUCTIONS = """You are Karigar Assistant, a helpful AI assistant for the Karigar hyperlocal services marketplace. You help customers find service providers, manage bookings, and answer questions.
 
 Your capabilities:
 1. Help find the right service provider using matching_agent
@@ -36,10 +32,42 @@ You can hand off to specialized agents when needed:
 - scheduling_agent: For time slot suggestions
 - pricing_agent: For pricing information
 - recommendation_agent: For personalized recommendations"""
-        
+
+
+_PROVIDER_CHAT_INSTRUCTIONS = """You are Karigar Assistant, a helpful AI assistant for service providers on the Karigar platform. You help providers manage their business, bookings, and services.
+
+Your capabilities:
+1. Help manage booking requests (accept, decline, reschedule)
+2. Suggest optimal availability and scheduling using scheduling_agent
+3. Provide pricing recommendations using pricing_agent
+4. Help improve provider profile and services
+5. Answer questions about bookings, customers, and platform features
+6. Provide business insights and tips
+7. Help with verification and document requirements
+
+Guidelines:
+- Be professional, helpful, and business-focused
+- Use natural language, not technical jargon
+- When providers need scheduling help, use scheduling_agent
+- When providers ask about pricing, use pricing_agent
+- Provide actionable advice for growing their business
+- Help them understand booking management best practices
+- If you don't know something, admit it and suggest contacting support
+- Keep responses concise but informative
+- Always be professional and respectful
+
+You can hand off to specialized agents when needed:
+- scheduling_agent: For time slot and availability suggestions
+- pricing_agent: For pricing recommendations"""
+
+
+class CustomerChatAgent(BaseAgent):
+    """Chat agent for customer portal - helps customers with bookings, providers, and support."""
+    
+    def __init__(self):
         super().__init__(
             agent_name="customer_chat_agent",
-            instructions=instructions,
+            instructions=_CUSTOMER_CHAT_INSTRUCTIONS,
             handoffs=["matching_agent", "scheduling_agent", "pricing_agent", "recommendation_agent"]
         )
     
@@ -72,35 +100,9 @@ class ProviderChatAgent(BaseAgent):
     """Chat agent for provider portal - helps providers manage bookings, services, and business."""
     
     def __init__(self):
-        instructions = """You are Karigar Assistant, a helpful AI assistant for service providers on the Karigar platform. You help providers manage their business, bookings, and services.
-
-Your capabilities:
-1. Help manage booking requests (accept, decline, reschedule)
-2. Suggest optimal availability and scheduling using scheduling_agent
-3. Provide pricing recommendations using pricing_agent
-4. Help improve provider profile and services
-5. Answer questions about bookings, customers, and platform features
-6. Provide business insights and tips
-7. Help with verification and document requirements
-
-Guidelines:
-- Be professional, helpful, and business-focused
-- Use natural language, not technical jargon
-- When providers need scheduling help, use scheduling_agent
-- When providers ask about pricing, use pricing_agent
-- Provide actionable advice for growing their business
-- Help them understand booking management best practices
-- If you don't know something, admit it and suggest contacting support
-- Keep responses concise but informative
-- Always be professional and respectful
-
-You can hand off to specialized agents when needed:
-- scheduling_agent: For time slot and availability suggestions
-- pricing_agent: For pricing recommendations"""
-        
         super().__init__(
             agent_name="provider_chat_agent",
-            instructions=instructions,
+            instructions=_PROVIDER_CHAT_INSTRUCTIONS,
             handoffs=["scheduling_agent", "pricing_agent"]
         )
     
@@ -126,3 +128,26 @@ You can hand off to specialized agents when needed:
             "fallback": True
         }
 
+
+# Shared instance, created on first use
+_customer_chat_agent: Optional[CustomerChatAgent] = None
+
+
+def get_customer_chat_agent() -> CustomerChatAgent:
+    """Get the shared customer chat agent."""
+    global _customer_chat_agent
+    if _customer_chat_agent is None:
+        _customer_chat_agent = CustomerChatAgent()
+    return _customer_chat_agent
+
+
+# Shared instance, created on first use
+_provider_chat_agent: Optional[ProviderChatAgent] = None
+
+
+def get_provider_chat_agent() -> ProviderChatAgent:
+    """Get the shared provider chat agent."""
+    global _provider_chat_agent
+    if _provider_chat_agent is None:
+        _provider_chat_agent = ProviderChatAgent()
+    return _provider_chat_agent
@@ -1,15 +1,11 @@
 """Matching agent for intelligent provider matching using OpenAI Agents SDK."""
-from typing import Dict, Any, List
-import json
+from typing import Dict, Any, List, Optional
+import heapq
 
 from app.agents.base import BaseAgent
 
 
-class MatchingAgent(BaseAgent):
-    """Agent for matching customers with best-fit service providers."""
-    
-    def __init__(self):
-        instructions = """You are a service provider matching agent. Your role is to analyze customer requirements and find the best matching service providers.
+_INSTRUCTIONS = """You are a service provider matching agent. Your role is to analyze customer requirements and find the best matching service providers.
 
 Consider:
 1. Service category and specific requirements
@@ -34,11 +30,18 @@ Return a JSON response with:
     ],
     "summary": "overall matching summary"
 }"""
-        
+
+
+class MatchingAgent(BaseAgent):
+    """Agent for matching customers with best-fit service providers."""
+    
+    expects_json = True
+    
+    def __init__(self):
         # Can hand off to scheduling agent if needed
         super().__init__(
             agent_name="matching_agent",
-            instructions=instructions,
+            instructions=_INSTRUCTIONS,
             handoffs=["scheduling_agent"]
         )
     
@@ -47,18 +50,10 @@ Return a JSON response with:
         return "Hand off to scheduling_agent when customer needs help finding available time slots after provider selection."
     
     def _parse_response(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Parse matching agent response."""
-        import re
-        
+        """Parse matching agent response (JSON mode output)."""
         try:
-            # Try to extract JSON from response
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            
-            # Try direct JSON parse
-            return json.loads(content)
-        except (json.JSONDecodeError, AttributeError):
+            return self._extract_json(content)
+        except (ValueError, AttributeError):
             # Fallback: create response from text
             return {
                 "matches": self._create_fallback_matches(context),
@@ -67,40 +62,39 @@ Return a JSON response with:
     
     def _create_fallback_matches(self, context: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Create fallback matches based on simple rules."""
-        matches = []
         providers = context.get("available_providers", [])
         
-        for provider in providers:
-            score = 50.0  # Base score
-            
-            # Add score based on rating
-            rating = provider.get("rating", 0)
-            score += (rating - 3.0) * 10  # Boost for ratings above 3.0
+        # Score all providers from flat columns, then build dicts for the winners only
+        ratings = [p.get("rating", 0) for p in providers]
+        distances = [p.get("distance_km", 100) for p in providers]
+        completion_rates = [p.get("completion_rate", 0) for p in providers]
+        
+        scores = []
+        for rating, distance, completion_rate in zip(ratings, distances, completion_rates):
+            score = 50.0 + (rating - 3.0) * 10  # Boost for ratings above 3.0
             
-            # Add score based on distance (closer is better)
-            distance = provider.get("distance_km", 100)
+            # Closer is better
             if distance < 5:
                 score += 20
             elif distance < 10:
                 score += 10
             
-            # Add score based on completion rate
-            completion_rate = provider.get("completion_rate", 0)
             score += (completion_rate - 80) * 0.2
-            
-            score = max(0, min(100, score))  # Clamp to 0-100
-            
-            matches.append({
-                "provider_id": provider.get("id"),
-                "match_score": round(score, 2),
-                "reasoning": f"Based on rating ({rating}), distance ({distance}km), and completion rate ({completion_rate}%)",
+            scores.append(max(0, min(100, score)))  # Clamp to 0-100
+        
+        # Select the top 5 by match score without sorting the full pool
+        top = heapq.nlargest(5, range(len(scores)), key=scores.__getitem__)
+        
+        return [
+            {
+                "provider_id": providers[i].get("id"),
+                "match_score": round(scores[i], 2),
+                "reasoning": f"Based on rating ({ratings[i]}), distance ({distances[i]}km), and completion rate ({completion_rates[i]}%)",
                 "strengths": [],
                 "concerns": []
-            })
-        
-        # Sort by match score descending
-        matches.sort(key=lambda x: x["match_score"], reverse=True)
-        return matches[:5]  # Return top 5
+            }
+            for i in top
+        ]
     
     def _get_fallback_response(self, context: Dict[str, Any], error: str) -> Dict[str, Any]:
         """Get fallback response when matching agent fails."""
@@ -109,3 +103,15 @@ Return a JSON response with:
             "summary": f"Fallback matching used due to error: {error}",
             "fallback": True
         }
+
+
+# Shared instance, created on first use
+_matching_agent: Optional[MatchingAgent] = None
+
+
+def get_matching_agent() -> MatchingAgent:
+    """Get the shared matching agent."""
+    global _matching_agent
+    if _matching_agent is None:
+        _matching_agent = MatchingAgent()
+    return _matching_agent
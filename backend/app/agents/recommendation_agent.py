@@ -1,14 +1,11 @@
 """Recommendation agent for personalized provider recommendations using OpenAI Agents SDK."""
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+import heapq
 
 from app.agents.base import BaseAgent
 
 
-class RecommendationAgent(BaseAgent):
-    """Agent for personalized provider recommendations based on user history."""
-    
-    def __init__(self):
-        instructions = """You are a recommendation agent. Suggest service providers based on user preferences and history.
+_INSTRUCTIONS = """You are a recommendation agent. Suggest service providers based on user preferences and history.
 
 Consider:
 1. User's past bookings and ratings
@@ -37,10 +34,19 @@ Return a JSON response with:
     },
     "summary": "overall recommendation summary"
 }"""
-        
+
+
+# Number of providers returned by rule-based ranking
+_RANKING_LIMIT = 10
+
+
+class RecommendationAgent(BaseAgent):
+    """Agent for personalized provider recommendations based on user history."""
+    
+    def __init__(self):
         super().__init__(
             agent_name="recommendation_agent",
-            instructions=instructions,
+            instructions=_INSTRUCTIONS,
             handoffs=["matching_agent"]  # Can hand off to matching agent for detailed matching
         )
     
@@ -50,47 +56,46 @@ Return a JSON response with:
     
     def _parse_response(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Parse recommendation agent response."""
-        import re
-        import json
-        
         try:
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            return json.loads(content)
-        except (json.JSONDecodeError, AttributeError):
+            return self._extract_json(content)
+        except (ValueError, AttributeError):
             return {
                 "recommendations": self._create_fallback_recommendations(context),
                 "personalization_insights": {},
                 "summary": "Fallback recommendations"
             }
     
+    def _answer_without_llm(self, context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Rank small candidate pools directly; every provider is returned either way."""
+        if len(context.get("available_providers", [])) > _RANKING_LIMIT:
+            return None
+        
+        return {
+            "recommendations": self._create_fallback_recommendations(context),
+            "personalization_insights": {},
+            "summary": "Ranked by rating and distance"
+        }
+    
     def _create_fallback_recommendations(self, context: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Create fallback recommendations based on simple rules."""
-        recommendations = []
         available_providers = context.get("available_providers", [])
-        user_history = context.get("user_history", {})
         
-        # Sort by rating and distance
-        sorted_providers = sorted(
-            available_providers,
-            key=lambda p: (
-                -float(p.get("rating", 0)),  # Higher rating first
-                float(p.get("distance_km", 100))  # Closer distance second
-            )
-        )
+        # Convert the ranking columns once instead of inside the sort key
+        ratings = [float(p.get("rating", 0)) for p in available_providers]
+        distances = [float(p.get("distance_km", 100)) for p in available_providers]
         
-        for i, provider in enumerate(sorted_providers[:10]):
-            confidence = 0.8 - (i * 0.05)  # Decreasing confidence
-            
-            recommendations.append({
-                "provider_id": provider.get("id"),
-                "confidence": round(confidence, 2),
-                "reasoning": f"High rating ({provider.get('rating')}) and nearby ({provider.get('distance_km')}km)",
-                "match_factors": ["rating", "proximity"]
-            })
+        # Top providers by rating (higher first), then distance (closer first)
+        order = heapq.nsmallest(_RANKING_LIMIT, range(len(available_providers)), key=lambda i: (-ratings[i], distances[i]))
         
-        return recommendations
+        return [
+            {
+                "provider_id": available_providers[i].get("id"),
+                "confidence": round(0.8 - (rank * 0.05), 2),  # Decreasing confidence
+                "reasoning": f"High rating ({available_providers[i].get('rating')}) and nearby ({available_providers[i].get('distance_km')}km)",
+                "match_factors": ["rating", "proximity"]
+            }
+            for rank, i in enumerate(order)
+        ]
     
     def _get_fallback_response(self, context: Dict[str, Any], error: str) -> Dict[str, Any]:
         """Get fallback response when recommendation agent fails."""
@@ -100,3 +105,15 @@ Return a JSON response with:
             "summary": f"Fallback recommendations used due to error: {error}",
             "fallback": True
         }
+
+
+# Shared instance, created on first use
+_recommendation_agent: Optional[RecommendationAgent] = None
+
+
+def get_recommendation_agent() -> RecommendationAgent:
+    """Get the shared recommendation agent."""
+    global _recommendation_agent
+    if _recommendation_agent is None:
+        _recommendation_agent = RecommendationAgent()
+    return _recommendation_agent
@@ -1,14 +1,10 @@
 """Review analysis agent for sentiment analysis and fake review detection using OpenAI Agents SDK."""
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 from app.agents.base import BaseAgent
 
 
-class ReviewAnalysisAgent(BaseAgent):
-    """Agent for analyzing review sentiment and detecting fake reviews."""
-    
-    def __init__(self):
-        instructions = """You are a review analysis agent. Analyze customer reviews for quality and authenticity.
+_INSTRUCTIONS = """You are a review analysis agent. Analyze customer reviews for quality and authenticity.
 
 Evaluate:
 1. Sentiment (positive, neutral, negative)
@@ -30,10 +26,33 @@ Return a JSON response with:
     "summary": "overall analysis summary",
     "red_flags": ["any", "suspicious", "indicators"]
 }"""
-        
+
+
+# Reviews packed into a single model run by analyze_batch
+REVIEW_BATCH_SIZE = 25
+
+# Rule-based (sentiment_score, sentiment) for each star rating
+_SENTIMENT_BY_RATING = {
+    1: (-0.7, "negative"),
+    2: (-0.7, "negative"),
+    3: (0.0, "neutral"),
+    4: (0.7, "positive"),
+    5: (0.7, "positive"),
+}
+
+
+class ReviewAnalysisAgent(BaseAgent):
+    """Agent for analyzing review sentiment and detecting fake reviews."""
+    
+    expects_json = True
+    # Each review needs its own sentiment and authenticity verdict; a similar
+    # review from another customer or provider is not a safe substitute
+    use_semantic_cache = False
+    
+    def __init__(self):
         super().__init__(
             agent_name="review_agent",
-            instructions=instructions,
+            instructions=_INSTRUCTIONS,
             handoffs=[]
         )
     
@@ -43,36 +62,51 @@ Return a JSON response with:
     
     def _parse_response(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Parse review analysis agent response."""
-        import re
-        import json
-        
         try:
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            return json.loads(content)
-        except (json.JSONDecodeError, AttributeError):
+            return self._extract_json(content)
+        except (ValueError, AttributeError):
             return self._create_fallback_analysis(context)
     
+    async def analyze_batch(self, reviews: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Analyze many reviews with one model run per REVIEW_BATCH_SIZE reviews.
+        
+        Args:
+            reviews: Review contexts, in the same shape `execute` takes
+        
+        Returns:
+            One analysis per review, in order. Reviews in a chunk the model
+            could not answer get the rule-based analysis.
+        """
+        analyses = []
+        for start in range(0, len(reviews), REVIEW_BATCH_SIZE):
+            chunk = reviews[start:start + REVIEW_BATCH_SIZE]
+            try:
+                outputs = await self.circuit_breaker.call_async(
+                    self._run_combined,
+                    [self._build_user_message(review) for review in chunk]
+                )
+            except Exception:
+                analyses.extend(self._create_fallback_analysis(review) for review in chunk)
+                continue
+            
+            analyses.extend(
+                self._parse_response(output, review) for output, review in zip(outputs, chunk)
+            )
+        
+        return analyses
+    
     def _create_fallback_analysis(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Create fallback analysis based on rating."""
         rating = int(context.get("rating", 3))
         review_text = context.get("review_text", "")
         
-        # Simple sentiment based on rating
-        if rating >= 4:
-            sentiment_score = 0.7
-            sentiment = "positive"
-        elif rating == 3:
-            sentiment_score = 0.0
-            sentiment = "neutral"
-        else:
-            sentiment_score = -0.7
-            sentiment = "negative"
+        # Simple sentiment based on rating; out-of-range ratings take the nearest star
+        sentiment_score, sentiment = _SENTIMENT_BY_RATING[min(5, max(1, rating))]
         
         # Quality score based on text length
         text_length = len(review_text) if review_text else 0
-        quality_score = min(1.0, text_length / 100)  # Higher quality for longer reviews
+        quality_score = min(1.0, text_length * 0.01)  # Higher quality for longer reviews
         
         return {
             "sentiment_score": round(sentiment_score, 2),
@@ -91,3 +125,15 @@ Return a JSON response with:
         analysis["summary"] = f"Fallback analysis used due to error: {error}"
         analysis["fallback"] = True
         return analysis
+
+
+# Shared instance, created on first use
+_review_agent: Optional[ReviewAnalysisAgent] = None
+
+
+def get_review_agent() -> ReviewAnalysisAgent:
+    """Get the shared review analysis agent."""
+    global _review_agent
+    if _review_agent is None:
+        _review_agent = ReviewAnalysisAgent()
+    return _review_agent
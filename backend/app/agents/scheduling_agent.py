@@ -1,15 +1,11 @@
 """Scheduling agent for optimal time slot suggestions using OpenAI Agents SDK."""
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 
 from app.agents.base import BaseAgent
 
 
-class SchedulingAgent(BaseAgent):
-    """Agent for finding optimal time slots and resolving scheduling conflicts."""
-    
-    def __init__(self):
-        instructions = """You are a scheduling optimization agent. Your role is to suggest the best time slots for service bookings.
+_INSTRUCTIONS = """You are a scheduling optimization agent. Your role is to suggest the best time slots for service bookings.
 
 Consider:
 1. Customer's preferred time windows
@@ -41,10 +37,27 @@ Return a JSON response with:
     ],
     "recommendations": "overall scheduling recommendations"
 }"""
-        
+
+
+# Default 2-hour slots from the preferred start: (start offset, end offset, confidence, reasoning)
+_DEFAULT_SLOTS = tuple(
+    (
+        timedelta(hours=i * 2),
+        timedelta(hours=i * 2 + 2),
+        0.7 - (i * 0.1),
+        f"Suggested slot {i + 1} based on preferred time"
+    )
+    for i in range(3)
+)
+
+
+class SchedulingAgent(BaseAgent):
+    """Agent for finding optimal time slots and resolving scheduling conflicts."""
+    
+    def __init__(self):
         super().__init__(
             agent_name="scheduling_agent",
-            instructions=instructions,
+            instructions=_INSTRUCTIONS,
             handoffs=[]  # Scheduling agent typically doesn't hand off
         )
     
@@ -54,21 +67,26 @@ Return a JSON response with:
     
     def _parse_response(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Parse scheduling agent response."""
-        import re
-        import json
-        
         try:
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            return json.loads(content)
-        except (json.JSONDecodeError, AttributeError):
+            return self._extract_json(content)
+        except (ValueError, AttributeError):
             return {
                 "suggested_slots": self._create_fallback_slots(context),
                 "alternatives": [],
                 "recommendations": content[:500] if content else "Scheduling analysis completed"
             }
     
+    def _answer_without_llm(self, context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Skip the model when there is neither availability nor a preferred date to work from."""
+        if context.get("available_slots") or context.get("preferred_date"):
+            return None
+        
+        return {
+            "suggested_slots": [],
+            "alternatives": [],
+            "recommendations": "No availability or preferred date to schedule against"
+        }
+    
     def _create_fallback_slots(self, context: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Create fallback time slots based on availability."""
         slots = []
@@ -81,14 +99,12 @@ Return a JSON response with:
             # Generate default slots if none provided
             if preferred_date and preferred_time_start:
                 base_datetime = datetime.fromisoformat(f"{preferred_date}T{preferred_time_start}")
-                for i in range(3):
-                    slot_start = base_datetime + timedelta(hours=i*2)
-                    slot_end = slot_start + timedelta(hours=2)
+                for start_offset, end_offset, confidence, reasoning in _DEFAULT_SLOTS:
                     slots.append({
-                        "start_datetime": slot_start.isoformat(),
-                        "end_datetime": slot_end.isoformat(),
-                        "confidence": 0.7 - (i * 0.1),
-                        "reasoning": f"Suggested slot {i+1} based on preferred time",
+                        "start_datetime": (base_datetime + start_offset).isoformat(),
+                        "end_datetime": (base_datetime + end_offset).isoformat(),
+                        "confidence": confidence,
+                        "reasoning": reasoning,
                         "conflicts": []
                     })
         else:
@@ -112,3 +128,15 @@ Return a JSON response with:
             "recommendations": f"Fallback scheduling used due to error: {error}",
             "fallback": True
         }
+
+
+# Shared instance, created on first use
+_scheduling_agent: Optional[SchedulingAgent] = None
+
+
+def get_scheduling_agent() -> SchedulingAgent:
+    """Get the shared scheduling agent."""
+    global _scheduling_agent
+    if _scheduling_agent is None:
+        _scheduling_agent = SchedulingAgent()
+    return _scheduling_agent
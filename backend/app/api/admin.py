@@ -1,14 +1,22 @@
 """Admin endpoints."""
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
-from typing import List, Optional
+from sqlalchemy import select, update, delete, func, and_, or_, text, lambda_stmt, tuple_
+from sqlalchemy.orm import selectinload
+from pydantic import TypeAdapter
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime, date
-
-from app.core.security import require_admin, get_current_user
-from app.core.exceptions import NotFoundError, BadRequestError
-from app.db.client import get_db
+import asyncio
+import base64
+import orjson
+
+from app.core.security import require_admin, get_current_user, invalidate_admin_cache
+from app.core.exceptions import NotFoundError, BadRequestError, ForbiddenError
+from app.core.local_cache import LocalTTLCache
+from app.core.analytics_cache import get_analytics_cache
+from app.db.client import get_db, AsyncSessionLocal
 from app.db.models import (
     User, CustomerProfile, ProviderProfile, Booking as BookingModel,
     Review, Dispute, Service, ServiceCategory
@@ -23,7 +31,150 @@ from app.domain.models import (
     PaginatedResponse
 )
 
-router = APIRouter(prefix="/api/v1/admin", tags=["admin"])
+router = APIRouter(prefix="/api/v1/admin", tags=["admin"], default_response_class=ORJSONResponse)
+
+# Validators for list responses, built once and run over whole result sets
+_users_adapter = TypeAdapter(List[UserProfile])
+_providers_adapter = TypeAdapter(List[ProviderProfileResponse])
+_bookings_adapter = TypeAdapter(List[Booking])
+_reviews_adapter = TypeAdapter(List[ReviewResponse])
+
+# Dashboard analytics are reused for a short window in each process (in front
+# of the shared Redis tier), and concurrent requests for the same figures
+# share a single computation. Booking traffic does not invalidate them; the
+# figures may lag by up to the two TTLs.
+ANALYTICS_CACHE_TTL_SECONDS = 15.0
+_local_analytics = LocalTTLCache(maxsize=128, ttl=ANALYTICS_CACHE_TTL_SECONDS)
+_analytics_inflight: Dict[str, asyncio.Task] = {}
+
+# Row estimate above which unfiltered list totals skip the exact count
+APPROXIMATE_COUNT_THRESHOLD = 10000
+
+
+async def _count(db: AsyncSession, model, filters: list) -> int:
+    """
+    Count the rows of model matching filters.
+    
+    Unfiltered counts over large tables use the planner's row estimate instead
+    of scanning the table. Small tables, and tables that have never been
+    analyzed (negative estimate), get an exact count.
+    """
+    if not filters:
+        result = await db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table_name"),
+            {"table_name": model.__tablename__}
+        )
+        estimate = result.scalar()
+        if estimate is not None and estimate >= APPROXIMATE_COUNT_THRESHOLD:
+            return estimate
+    
+    count_result = await db.execute(select(func.count(model.id)).where(*filters))
+    return count_result.scalar()
+
+
+def _encode_cursor(row) -> str:
+    """Encode a row's (created_at, id) position as an opaque page cursor."""
+    raw = orjson.dumps({"created_at": row.created_at, "id": row.id})
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a page cursor back into its (created_at, id) position."""
+    try:
+        data = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(data["created_at"]), UUID(data["id"])
+    except (ValueError, KeyError, TypeError, AttributeError):
+        # AttributeError covers non-string ids, which UUID() does not reject with ValueError
+        raise BadRequestError("Invalid cursor")
+
+
+def _paginate(query, model, cursor: Optional[str], page: int, page_size: int):
+    """
+    Order a list query newest first and limit it to one page.
+    
+    With a cursor the page starts after that (created_at, id) position
+    (keyset pagination); without one it falls back to the page offset. One
+    extra row is fetched to tell whether another page follows.
+    """
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+    if cursor is not None:
+        query = query.where(tuple_(model.created_at, model.id) < tuple_(*_decode_cursor(cursor)))
+    else:
+        query = query.offset((page - 1) * page_size)
+    return query.limit(page_size + 1)
+
+
+def _split_page(rows, page_size: int) -> Tuple[list, Optional[str]]:
+    """Trim the look-ahead row and return the page with the cursor for the next one."""
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        return rows, _encode_cursor(rows[-1])
+    return rows, None
+
+
+async def _fetch_all(statement) -> list:
+    """
+    Run a read-only statement on its own pooled session and return its rows.
+    
+    Independent analytics queries go through this so they can run
+    concurrently, each on a separate connection.
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(statement)
+        return result.all()
+
+
+# Rows fetched and serialised per round when streaming unbounded lists
+STREAM_CHUNK_SIZE = 500
+
+
+async def _stream_json_array(statement, adapter: TypeAdapter) -> AsyncIterator[bytes]:
+    """
+    Stream a query's ORM rows as a JSON array, one chunk at a time.
+    
+    Rows are fetched through a server-side cursor and validated and encoded
+    per chunk, so memory stays bounded however many rows match. The stream
+    runs on its own session because it outlives the request's dependencies.
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(statement.execution_options(yield_per=STREAM_CHUNK_SIZE))
+        yield b"["
+        first = True
+        async for rows in result.scalars().partitions():
+            # Encode the chunk as an array and splice its items into the stream
+            chunk = adapter.dump_json(adapter.validate_python(rows, from_attributes=True))[1:-1]
+            if chunk:
+                yield chunk if first else b"," + chunk
+                first = False
+        yield b"]"
+
+
+async def _cached_analytics(key: str, compute: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Return cached analytics for key, computing them at most once at a time.
+    
+    Callers that arrive while a computation is running await the same task
+    instead of starting their own. The task is shielded so a disconnecting
+    caller does not cancel it for the others.
+    """
+    cached = _local_analytics.get(key)
+    if cached is not None:
+        return cached
+    
+    task = _analytics_inflight.get(key)
+    if task is None:
+        async def run():
+            try:
+                result = await get_analytics_cache().get_or_compute(key, compute)
+                _local_analytics.set(key, result)
+                return result
+            finally:
+                _analytics_inflight.pop(key, None)
+        
+        task = asyncio.create_task(run())
+        _analytics_inflight[key] = task
+    
+    return await asyncio.shield(task)
 
 
 @router.get("/users", response_model=PaginatedResponse)
@@ -33,40 +184,44 @@ async def list_users(
     search: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(True),
     current_user: User = Depends(require_admin),
     db: AsyncSession = Depends(get_db)
 ):
     """List all users with filters."""
-    query = select(User)
-    
+    filters = []
     if role:
-        query = query.where(User.role == role)
+        filters.append(User.role == role)
     if is_active is not None:
-        query = query.where(User.is_active == is_active)
+        filters.append(User.is_active == is_active)
     if search:
-        query = query.where(
+        filters.append(
             or_(
                 User.email.ilike(f"%{search}%"),
                 User.phone.ilike(f"%{search}%")
             )
         )
     
-    # Get total count
-    count_result = await db.execute(select(func.count()).select_from(query.subquery()))
-    total = count_result.scalar()
+    query = select(User).where(*filters)
+    
+    # Page-number requests keep the total unless opted out; cursor pages skip it
+    total = None
+    if include_total and cursor is None:
+        total = await _count(db, User, filters)
     
     # Get paginated results
-    query = query.order_by(User.created_at.desc())
-    query = query.offset((page - 1) * page_size).limit(page_size)
+    query = _paginate(query, User, cursor, page, page_size)
     
     result = await db.execute(query)
-    users = result.scalars().all()
+    users, next_cursor = _split_page(result.scalars().all(), page_size)
     
     return PaginatedResponse.create(
-        items=[UserProfile.model_validate(u) for u in users],
+        items=_users_adapter.validate_python(users, from_attributes=True),
         total=total,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        next_cursor=next_cursor
     )
 
 
@@ -77,7 +232,7 @@ async def get_user(
     db: AsyncSession = Depends(get_db)
 ):
     """Get user details."""
-    result = await db.execute(select(User).where(User.id == user_id))
+    result = await db.execute(lambda_stmt(lambda: select(User).where(User.id == user_id)))
     user = result.scalar_one_or_none()
     
     if not user:
@@ -95,37 +250,66 @@ async def update_user(
     db: AsyncSession = Depends(get_db)
 ):
     """Update user (suspend, activate, verify)."""
-    result = await db.execute(select(User).where(User.id == user_id))
+    values = {}
+    if is_active is not None:
+        values["is_active"] = is_active
+    if is_verified is not None:
+        values["is_verified"] = is_verified
+    
+    if values:
+        query = update(User).where(User.id == user_id)
+        if is_active is False:
+            # Admin accounts cannot be suspended
+            query = query.where(User.role != "admin")
+        result = await db.execute(query.values(**values).returning(User))
+    else:
+        result = await db.execute(lambda_stmt(lambda: select(User).where(User.id == user_id)))
     user = result.scalar_one_or_none()
     
     if not user:
+        if is_active is False:
+            role_result = await db.execute(lambda_stmt(lambda: select(User.role).where(User.id == user_id)))
+            if role_result.scalar_one_or_none() == "admin":
+                raise ForbiddenError("Cannot suspend admin users")
         raise NotFoundError("User not found")
     
-    if is_active is not None:
-        user.is_active = is_active
-    if is_verified is not None:
-        user.is_verified = is_verified
-    
     await db.commit()
-    await db.refresh(user)
+    if values:
+        await invalidate_admin_cache()
     
     return UserProfile.model_validate(user)
 
 
+async def _invalidate_analytics():
+    """Drop cached analytics after a change to the figures they report."""
+    _local_analytics.clear()
+    await get_analytics_cache().invalidate()
+
+
+async def _raise_provider_not_pending(db: AsyncSession, provider_id: UUID):
+    """Raise the error for a provider decision that matched no pending provider."""
+    result = await db.execute(
+        lambda_stmt(lambda: select(ProviderProfile.status).where(ProviderProfile.id == provider_id))
+    )
+    provider_status = result.scalar_one_or_none()
+    
+    if provider_status is None:
+        raise NotFoundError("Provider not found")
+    raise BadRequestError(f"Provider is already {provider_status}")
+
+
 @router.get("/providers/pending", response_model=List[ProviderProfileResponse])
 async def list_pending_providers(
-    current_user: User = Depends(require_admin),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(require_admin)
 ):
     """List pending provider approvals."""
-    result = await db.execute(
+    query = (
         select(ProviderProfile)
+        .options(selectinload(ProviderProfile.user))
         .where(ProviderProfile.status == "pending")
         .order_by(ProviderProfile.created_at)
     )
-    providers = result.scalars().all()
-    
-    return [ProviderProfileResponse.model_validate(p) for p in providers]
+    return StreamingResponse(_stream_json_array(query, _providers_adapter), media_type="application/json")
 
 
 @router.post("/providers/{provider_id}/approve")
@@ -136,41 +320,45 @@ async def approve_provider(
     db: AsyncSession = Depends(get_db)
 ):
     """Approve a provider."""
+    # Approve the profile and verify its user in one statement: the CTE
+    # updates the profile and the outer UPDATE verifies the user it returns
+    approved = (
+        update(ProviderProfile)
+        .where(ProviderProfile.id == provider_id, ProviderProfile.status == "pending")
+        .values(status="approved", is_verified=True)
+        .returning(*ProviderProfile.__table__.c)
+        .cte("approved")
+    )
     result = await db.execute(
-        select(ProviderProfile).where(ProviderProfile.id == provider_id)
+        update(User)
+        .where(User.id == approved.c.user_id)
+        .values(is_verified=True)
+        .returning(User, *approved.c)
+        .execution_options(synchronize_session=False)
     )
-    provider = result.scalar_one_or_none()
+    row = result.first()
     
-    if not provider:
-        raise NotFoundError("Provider not found")
+    if not row:
+        await _raise_provider_not_pending(db, provider_id)
     
-    if provider.status != "pending":
-        raise BadRequestError(f"Provider is already {provider.status}")
-    
-    provider.status = "approved"
-    provider.is_verified = True
-    
-    # Update user verification status
-    user_result = await db.execute(select(User).where(User.id == provider.user_id))
-    user = user_result.scalar_one_or_none()
-    if user:
-        user.is_verified = True
+    user = row[0]
+    provider = dict(zip(approved.c.keys(), row[1:]))
     
     await db.commit()
-    await db.refresh(provider)
+    await _invalidate_analytics()
     
     # Create notification
     from app.utils.notifications import create_notification
     await create_notification(
         db=db,
-        user_id=provider.user_id,
+        user_id=user.id,
         notification_type="system",
         title="Provider Account Approved",
         message="Your provider account has been approved. You can now start accepting bookings!",
-        data={"provider_id": str(provider.id)}
+        data={"provider_id": str(provider["id"])}
     )
     
-    return ProviderProfileResponse.model_validate(provider)
+    return ProviderProfileResponse.model_validate({**provider, "user": UserProfile.model_validate(user)})
 
 
 @router.post("/providers/{provider_id}/reject")
@@ -182,20 +370,21 @@ async def reject_provider(
 ):
     """Reject a provider."""
     result = await db.execute(
-        select(ProviderProfile).where(ProviderProfile.id == provider_id)
+        update(ProviderProfile)
+        .where(ProviderProfile.id == provider_id, ProviderProfile.status == "pending")
+        .values(status="rejected")
+        .returning(ProviderProfile)
     )
     provider = result.scalar_one_or_none()
     
     if not provider:
-        raise NotFoundError("Provider not found")
-    
-    if provider.status != "pending":
-        raise BadRequestError(f"Provider is already {provider.status}")
-    
-    provider.status = "rejected"
+        await _raise_provider_not_pending(db, provider_id)
     
     await db.commit()
-    await db.refresh(provider)
+    await _invalidate_analytics()
+    
+    # Load the user for the response
+    await db.get(User, provider.user_id)
     
     # Create notification
     from app.utils.notifications import create_notification
@@ -220,56 +409,65 @@ async def list_all_bookings(
     end_date: Optional[date] = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(True),
     current_user: User = Depends(require_admin),
     db: AsyncSession = Depends(get_db)
 ):
     """List all bookings with filters."""
-    query = select(BookingModel)
-    
+    filters = []
     if status:
-        query = query.where(BookingModel.status == status)
+        filters.append(BookingModel.status == status)
     if customer_id:
-        query = query.where(BookingModel.customer_id == customer_id)
+        filters.append(BookingModel.customer_id == customer_id)
     if provider_id:
-        query = query.where(BookingModel.provider_id == provider_id)
+        filters.append(BookingModel.provider_id == provider_id)
     if start_date:
-        query = query.where(BookingModel.created_at >= datetime.combine(start_date, datetime.min.time()))
+        filters.append(BookingModel.created_at >= datetime.combine(start_date, datetime.min.time()))
     if end_date:
-        query = query.where(BookingModel.created_at <= datetime.combine(end_date, datetime.max.time()))
+        filters.append(BookingModel.created_at <= datetime.combine(end_date, datetime.max.time()))
     
-    # Get total count
-    count_result = await db.execute(select(func.count()).select_from(query.subquery()))
-    total = count_result.scalar()
+    query = select(BookingModel).where(*filters)
     
-    # Get paginated results
-    query = query.order_by(BookingModel.created_at.desc())
-    query = query.offset((page - 1) * page_size).limit(page_size)
+    # Page-number requests keep the total unless opted out; cursor pages skip it
+    total = None
+    if include_total and cursor is None:
+        total = await _count(db, BookingModel, filters)
+    
+    # Get paginated results, loading the nested response relations in batches
+    query = query.options(
+        selectinload(BookingModel.customer).selectinload(CustomerProfile.user),
+        selectinload(BookingModel.provider).selectinload(ProviderProfile.user),
+        selectinload(BookingModel.service).selectinload(Service.category)
+    )
+    query = _paginate(query, BookingModel, cursor, page, page_size)
     
     result = await db.execute(query)
-    bookings = result.scalars().all()
+    bookings, next_cursor = _split_page(result.scalars().all(), page_size)
     
-    return PaginatedResponse.create(
-        items=[Booking.model_validate(b) for b in bookings],
+    response = PaginatedResponse.create(
+        items=_bookings_adapter.validate_python(bookings, from_attributes=True),
         total=total,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        next_cursor=next_cursor
     )
+    # Already validated; skip response_model re-validation and jsonable_encoder
+    return ORJSONResponse(content=response.model_dump(mode="json"))
 
 
 @router.get("/reviews/flagged", response_model=List[ReviewResponse])
 async def list_flagged_reviews(
-    current_user: User = Depends(require_admin),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(require_admin)
 ):
     """List flagged reviews for moderation."""
-    result = await db.execute(
+    query = (
         select(Review)
         .where(Review.is_flagged == True)
+        .options(selectinload(Review.customer).selectinload(CustomerProfile.user))
         .order_by(Review.created_at.desc())
     )
-    reviews = result.scalars().all()
-    
-    return [ReviewResponse.model_validate(r) for r in reviews]
+    return StreamingResponse(_stream_json_array(query, _reviews_adapter), media_type="application/json")
 
 
 @router.post("/reviews/{review_id}/moderate")
@@ -281,7 +479,22 @@ async def moderate_review(
     db: AsyncSession = Depends(get_db)
 ):
     """Moderate a flagged review."""
-    result = await db.execute(select(Review).where(Review.id == review_id))
+    if action == "remove":
+        # Nothing references reviews, so a plain DELETE needs no ORM cascade
+        result = await db.execute(
+            delete(Review).where(Review.id == review_id).returning(Review.id)
+        )
+        if result.scalar_one_or_none() is None:
+            raise NotFoundError("Review not found")
+        
+        await db.commit()
+        return {"message": "Review removed"}
+    
+    result = await db.execute(
+        select(Review)
+        .where(Review.id == review_id)
+        .options(selectinload(Review.customer).selectinload(CustomerProfile.user))
+    )
     review = result.scalar_one_or_none()
     
     if not review:
@@ -293,13 +506,10 @@ async def moderate_review(
     elif action == "reject":
         review.is_flagged = True
         review.flag_reason = reason or "Rejected by admin"
-    elif action == "remove":
-        await db.delete(review)
-        await db.commit()
-        return {"message": "Review removed"}
     
     await db.commit()
-    await db.refresh(review)
+    # Only the server-side timestamp is stale; a full refresh would drop the loaded customer
+    await db.refresh(review, attribute_names=["updated_at"])
     
     return ReviewResponse.model_validate(review)
 
@@ -309,47 +519,53 @@ async def list_disputes(
     status: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(True),
     current_user: User = Depends(require_admin),
     db: AsyncSession = Depends(get_db)
 ):
     """List all disputes."""
-    query = select(Dispute)
-    
+    filters = []
     if status:
-        query = query.where(Dispute.status == status)
+        filters.append(Dispute.status == status)
+    
+    # Select the response columns directly instead of hydrating ORM objects
+    query = (
+        select(
+            Dispute.id,
+            Dispute.booking_id,
+            Dispute.raised_by,
+            User.email.label("raised_by_email"),
+            Dispute.dispute_type,
+            Dispute.description,
+            Dispute.status,
+            Dispute.ai_resolution_suggestion,
+            Dispute.resolution,
+            Dispute.created_at,
+            Dispute.updated_at
+        )
+        .outerjoin(User, User.id == Dispute.raised_by)
+        .where(*filters)
+    )
     
-    # Get total count
-    count_result = await db.execute(select(func.count()).select_from(query.subquery()))
-    total = count_result.scalar()
+    # Page-number requests keep the total unless opted out; cursor pages skip it
+    total = None
+    if include_total and cursor is None:
+        total = await _count(db, Dispute, filters)
     
     # Get paginated results
-    query = query.order_by(Dispute.created_at.desc())
-    query = query.offset((page - 1) * page_size).limit(page_size)
+    query = _paginate(query, Dispute, cursor, page, page_size)
     
     result = await db.execute(query)
-    disputes = result.scalars().all()
-    
-    # Convert to dict for response
-    disputes_data = []
-    for dispute in disputes:
-        disputes_data.append({
-            "id": dispute.id,
-            "booking_id": dispute.booking_id,
-            "raised_by": dispute.raised_by,
-            "dispute_type": dispute.dispute_type,
-            "description": dispute.description,
-            "status": dispute.status,
-            "ai_resolution_suggestion": dispute.ai_resolution_suggestion,
-            "resolution": dispute.resolution,
-            "created_at": dispute.created_at,
-            "updated_at": dispute.updated_at
-        })
+    disputes, next_cursor = _split_page(result.all(), page_size)
+    disputes_data = [dict(row._mapping) for row in disputes]
     
     return PaginatedResponse.create(
         items=disputes_data,
         total=total,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        next_cursor=next_cursor
     )
 
 
@@ -360,7 +576,7 @@ async def get_dispute(
     db: AsyncSession = Depends(get_db)
 ):
     """Get dispute details."""
-    result = await db.execute(select(Dispute).where(Dispute.id == dispute_id))
+    result = await db.execute(lambda_stmt(lambda: select(Dispute).where(Dispute.id == dispute_id)))
     dispute = result.scalar_one_or_none()
     
     if not dispute:
@@ -390,60 +606,67 @@ async def resolve_dispute(
     db: AsyncSession = Depends(get_db)
 ):
     """Resolve a dispute."""
-    result = await db.execute(select(Dispute).where(Dispute.id == dispute_id))
+    result = await db.execute(
+        update(Dispute)
+        .where(Dispute.id == dispute_id)
+        .values(
+            status=resolution_data.status,
+            resolution=resolution_data.resolution,
+            # Keep existing notes when the resolution carries none
+            admin_notes=func.coalesce(resolution_data.admin_notes, Dispute.admin_notes),
+            resolved_by=current_user.id,
+            resolved_at=datetime.utcnow()
+        )
+        .returning(Dispute)
+    )
     dispute = result.scalar_one_or_none()
     
     if not dispute:
         raise NotFoundError("Dispute not found")
     
-    dispute.status = resolution_data.status
-    dispute.resolution = resolution_data.resolution
-    dispute.admin_notes = resolution_data.admin_notes
-    dispute.resolved_by = current_user.id
-    dispute.resolved_at = datetime.utcnow()
-    
     await db.commit()
-    await db.refresh(dispute)
     
     # Create notifications for both parties
     from app.utils.notifications import create_notification
     
-    # Get booking to find both parties
-    booking_result = await db.execute(
-        select(BookingModel).where(BookingModel.id == dispute.booking_id)
-    )
-    booking = booking_result.scalar_one_or_none()
+    # Both parties are stored on the dispute; older disputes predate that and
+    # are resolved through the booking in one query
+    parties = None
+    if dispute.customer_user_id and dispute.provider_user_id:
+        parties = (dispute.customer_user_id, dispute.provider_user_id)
+    else:
+        parties_result = await db.execute(
+            select(CustomerProfile.user_id, ProviderProfile.user_id)
+            .select_from(BookingModel)
+            .join(CustomerProfile, CustomerProfile.id == BookingModel.customer_id)
+            .join(ProviderProfile, ProviderProfile.id == BookingModel.provider_id)
+            .where(BookingModel.id == dispute.booking_id)
+        )
+        parties = parties_result.first()
     
-    if booking:
+    if parties:
+        customer_user_id, provider_user_id = parties
+        data = {"dispute_id": str(dispute.id), "booking_id": str(dispute.booking_id)}
+        
         # Notify customer
-        customer_result = await db.execute(
-            select(CustomerProfile).where(CustomerProfile.id == booking.customer_id)
+        await create_notification(
+            db=db,
+            user_id=customer_user_id,
+            notification_type="system",
+            title="Dispute Resolved",
+            message=f"Your dispute has been resolved: {resolution_data.resolution}",
+            data=data
         )
-        customer = customer_result.scalar_one_or_none()
-        if customer:
-            await create_notification(
-                db=db,
-                user_id=customer.user_id,
-                notification_type="system",
-                title="Dispute Resolved",
-                message=f"Your dispute has been resolved: {resolution_data.resolution}",
-                data={"dispute_id": str(dispute.id), "booking_id": str(booking.id)}
-            )
         
         # Notify provider
-        provider_result = await db.execute(
-            select(ProviderProfile).where(ProviderProfile.id == booking.provider_id)
+        await create_notification(
+            db=db,
+            user_id=provider_user_id,
+            notification_type="system",
+            title="Dispute Resolved",
+            message=f"The dispute has been resolved: {resolution_data.resolution}",
+            data=data
         )
-        provider = provider_result.scalar_one_or_none()
-        if provider:
-            await create_notification(
-                db=db,
-                user_id=provider.user_id,
-                notification_type="system",
-                title="Dispute Resolved",
-                message=f"The dispute has been resolved: {resolution_data.resolution}",
-                data={"dispute_id": str(dispute.id), "booking_id": str(booking.id)}
-            )
     
     return {
         "id": dispute.id,
@@ -457,100 +680,128 @@ async def resolve_dispute(
 async def get_platform_analytics(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
-    current_user: User = Depends(require_admin),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(require_admin)
 ):
     """Get platform analytics."""
-    # Total users
-    total_users = await db.execute(select(func.count(User.id)))
-    total_customers = await db.execute(
-        select(func.count(User.id)).where(User.role == "customer")
-    )
-    total_providers = await db.execute(
-        select(func.count(User.id)).where(User.role == "provider")
+    # Cached figures are plain JSON types; hand them straight to orjson
+    return ORJSONResponse(content=await _cached_analytics(
+        f"platform:{start_date}:{end_date}",
+        lambda: _compute_platform_analytics(start_date, end_date)
+    ))
+
+
+async def _compute_platform_analytics(start_date: Optional[date], end_date: Optional[date]) -> Dict[str, Any]:
+    """Compute the platform analytics figures."""
+    # User counts by role in one pass
+    users_query = select(
+        func.count(User.id).label("total"),
+        func.count(User.id).filter(User.role == "customer").label("customers"),
+        func.count(User.id).filter(User.role == "provider").label("providers")
     )
     
-    # Total bookings
-    bookings_query = select(func.count(BookingModel.id))
+    # Booking counts by status, plus the ranged total and revenue on the
+    # rollup row (status NULL), in one pass
+    bookings_filter = []
     if start_date:
-        bookings_query = bookings_query.where(BookingModel.created_at >= datetime.combine(start_date, datetime.min.time()))
+        bookings_filter.append(BookingModel.created_at >= datetime.combine(start_date, datetime.min.time()))
     if end_date:
-        bookings_query = bookings_query.where(BookingModel.created_at <= datetime.combine(end_date, datetime.max.time()))
-    
-    total_bookings = await db.execute(bookings_query)
+        bookings_filter.append(BookingModel.created_at <= datetime.combine(end_date, datetime.max.time()))
     
-    # Bookings by status
-    bookings_by_status = await db.execute(
-        select(BookingModel.status, func.count(BookingModel.id))
-        .group_by(BookingModel.status)
-    )
-    
-    # Total revenue
-    revenue_query = select(func.sum(BookingModel.final_price)).where(
+    revenue_filter = [
         BookingModel.payment_status == "paid",
         BookingModel.final_price.isnot(None)
-    )
+    ]
     if start_date:
-        revenue_query = revenue_query.where(BookingModel.completed_at >= datetime.combine(start_date, datetime.min.time()))
+        revenue_filter.append(BookingModel.completed_at >= datetime.combine(start_date, datetime.min.time()))
     if end_date:
-        revenue_query = revenue_query.where(BookingModel.completed_at <= datetime.combine(end_date, datetime.max.time()))
+        revenue_filter.append(BookingModel.completed_at <= datetime.combine(end_date, datetime.max.time()))
     
-    total_revenue = await db.execute(revenue_query)
+    total_bookings = func.count(BookingModel.id)
+    if bookings_filter:
+        total_bookings = total_bookings.filter(and_(*bookings_filter))
     
-    # Top categories
-    top_categories = await db.execute(
-        select(ServiceCategory.name, func.count(Service.id))
-        .join(Service)
-        .join(BookingModel)
+    bookings_query = (
+        select(
+            BookingModel.status.label("status"),
+            func.count(BookingModel.id).label("count"),
+            total_bookings.label("total"),
+            func.sum(BookingModel.final_price).filter(and_(*revenue_filter)).label("revenue")
+        )
+        .group_by(func.rollup(BookingModel.status))
+    )
+    
+    # Top categories; bookings are counted per service first so the join to
+    # categories covers one row per service instead of one per booking
+    service_bookings = (
+        select(BookingModel.service_id, func.count(BookingModel.id).label("bookings"))
+        .group_by(BookingModel.service_id)
+        .subquery()
+    )
+    category_bookings = func.sum(service_bookings.c.bookings)
+    top_categories_query = (
+        select(ServiceCategory.name, category_bookings)
+        .select_from(ServiceCategory)
+        .join(Service, Service.category_id == ServiceCategory.id)
+        .join(service_bookings, service_bookings.c.service_id == Service.id)
         .group_by(ServiceCategory.name)
-        .order_by(func.count(Service.id).desc())
+        .order_by(category_bookings.desc())
         .limit(10)
     )
     
+    users_rows, bookings_rows, top_categories = await asyncio.gather(
+        _fetch_all(users_query),
+        _fetch_all(bookings_query),
+        _fetch_all(top_categories_query)
+    )
+    users = users_rows[0]
+    
+    bookings_by_status = {}
+    bookings_total, revenue = 0, None
+    for row in bookings_rows:
+        if row.status is None:
+            bookings_total, revenue = row.total, row.revenue
+        else:
+            bookings_by_status[row.status] = row.count
+    
     return {
         "users": {
-            "total": total_users.scalar(),
-            "customers": total_customers.scalar(),
-            "providers": total_providers.scalar()
+            "total": users.total,
+            "customers": users.customers,
+            "providers": users.providers
         },
         "bookings": {
-            "total": total_bookings.scalar(),
-            "by_status": {row[0]: row[1] for row in bookings_by_status.fetchall()}
+            "total": bookings_total,
+            "by_status": bookings_by_status
         },
         "revenue": {
-            "total": float(total_revenue.scalar() or 0)
+            "total": float(revenue or 0)
         },
         "top_categories": [
-            {"name": row[0], "count": row[1]} for row in top_categories.fetchall()
+            {"name": row[0], "count": int(row[1])} for row in top_categories
         ]
     }
 
 
 @router.get("/analytics/providers")
 async def get_provider_analytics(
-    current_user: User = Depends(require_admin),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(require_admin)
 ):
     """Get provider analytics."""
-    # Provider stats
-    total_providers = await db.execute(
-        select(func.count(ProviderProfile.id))
-    )
-    approved_providers = await db.execute(
-        select(func.count(ProviderProfile.id)).where(ProviderProfile.status == "approved")
-    )
-    pending_providers = await db.execute(
-        select(func.count(ProviderProfile.id)).where(ProviderProfile.status == "pending")
-    )
-    
-    # Average rating
-    avg_rating = await db.execute(
-        select(func.avg(ProviderProfile.rating_average))
-        .where(ProviderProfile.status == "approved")
+    return ORJSONResponse(content=await _cached_analytics("providers", _compute_provider_analytics))
+
+
+async def _compute_provider_analytics() -> Dict[str, Any]:
+    """Compute the provider analytics figures."""
+    # Provider counts and average rating in one pass
+    stats_query = select(
+        func.count(ProviderProfile.id).label("total"),
+        func.count(ProviderProfile.id).filter(ProviderProfile.status == "approved").label("approved"),
+        func.count(ProviderProfile.id).filter(ProviderProfile.status == "pending").label("pending"),
+        func.avg(ProviderProfile.rating_average).filter(ProviderProfile.status == "approved").label("average_rating")
     )
     
     # Top providers by bookings
-    top_providers = await db.execute(
+    top_providers_query = (
         select(
             ProviderProfile.business_name,
             ProviderProfile.rating_average,
@@ -562,11 +813,17 @@ async def get_provider_analytics(
         .limit(10)
     )
     
+    stats_rows, top_providers = await asyncio.gather(
+        _fetch_all(stats_query),
+        _fetch_all(top_providers_query)
+    )
+    stats = stats_rows[0]
+    
     return {
-        "total": total_providers.scalar(),
-        "approved": approved_providers.scalar(),
-        "pending": pending_providers.scalar(),
-        "average_rating": float(avg_rating.scalar() or 0),
+        "total": stats.total,
+        "approved": stats.approved,
+        "pending": stats.pending,
+        "average_rating": float(stats.average_rating or 0),
         "top_providers": [
             {
                 "name": row[0],
@@ -574,7 +831,7 @@ async def get_provider_analytics(
                 "total_bookings": row[2],
                 "completion_rate": float(row[3])
             }
-            for row in top_providers.fetchall()
+            for row in top_providers
         ]
     }
 
@@ -583,40 +840,45 @@ async def get_provider_analytics(
 async def get_booking_analytics(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
-    current_user: User = Depends(require_admin),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(require_admin)
 ):
     """Get booking analytics."""
-    base_query = select(BookingModel)
+    return ORJSONResponse(content=await _cached_analytics(
+        f"bookings:{start_date}:{end_date}",
+        lambda: _compute_booking_analytics(start_date, end_date)
+    ))
+
+
+async def _compute_booking_analytics(start_date: Optional[date], end_date: Optional[date]) -> Dict[str, Any]:
+    """Compute the booking analytics figures."""
+    filters = []
     if start_date:
-        base_query = base_query.where(BookingModel.created_at >= datetime.combine(start_date, datetime.min.time()))
+        filters.append(BookingModel.created_at >= datetime.combine(start_date, datetime.min.time()))
     if end_date:
-        base_query = base_query.where(BookingModel.created_at <= datetime.combine(end_date, datetime.max.time()))
+        filters.append(BookingModel.created_at <= datetime.combine(end_date, datetime.max.time()))
     
-    # Bookings by status
-    bookings_by_status = await db.execute(
-        base_query.select_from(base_query.subquery())
-        .with_only_columns([BookingModel.status, func.count(BookingModel.id)])
+    # Bookings by status; the total and completed counts follow from it
+    status_query = (
+        select(BookingModel.status, func.count(BookingModel.id))
+        .where(*filters)
         .group_by(BookingModel.status)
     )
     
-    # Completion rate
-    completed = await db.execute(
-        base_query.where(BookingModel.status == "completed")
-    )
-    total = await db.execute(base_query)
-    
     # Average booking value
-    avg_value = await db.execute(
-        select(func.avg(BookingModel.final_price))
-        .where(BookingModel.final_price.isnot(None))
+    avg_value_query = select(func.avg(BookingModel.final_price)).where(BookingModel.final_price.isnot(None))
+    
+    status_rows, avg_value_rows = await asyncio.gather(
+        _fetch_all(status_query),
+        _fetch_all(avg_value_query)
     )
+    by_status = {row[0]: row[1] for row in status_rows}
+    total = sum(by_status.values())
+    completed = by_status.get("completed", 0)
     
     return {
-        "total": total.rowcount,
-        "completed": completed.rowcount,
-        "completion_rate": (completed.rowcount / total.rowcount * 100) if total.rowcount > 0 else 0,
-        "by_status": {row[0]: row[1] for row in bookings_by_status.fetchall()},
-        "average_value": float(avg_value.scalar() or 0)
+        "total": total,
+        "completed": completed,
+        "completion_rate": (completed / total * 100) if total > 0 else 0,
+        "by_status": by_status,
+        "average_value": float(avg_value_rows[0][0] or 0)
     }
-
@@ -1,8 +1,12 @@
 """Authentication endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, or_, lambda_stmt
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime
+from uuid import UUID
+import anyio
+import structlog
 
 from app.core.security import (
     create_access_token,
@@ -13,8 +17,9 @@ from app.core.security import (
     get_current_user,
 )
 from app.core.redis_client import get_redis
+from app.core.local_cache import LocalTTLCache
 from app.core.exceptions import UnauthorizedError, ConflictError, BadRequestError
-from app.db.client import get_db
+from app.db.client import get_db, AsyncSessionLocal
 from app.db.models import User, CustomerProfile, ProviderProfile
 from app.domain.models import (
     UserCreate,
@@ -26,8 +31,52 @@ from app.domain.models import (
     ProviderProfileCreate,
 )
 
+logger = structlog.get_logger()
+
 router = APIRouter(prefix="/api/v1/auth", tags=["authentication"])
 
+# Refresh token ids known to be revoked in this process. Refresh tokens are
+# single-use and revocation is permanent, so a cached "revoked" answer never
+# goes stale and replayed tokens are rejected without a Redis round-trip.
+_revoked_refresh_jtis = LocalTTLCache(maxsize=10000, ttl=3600.0)
+
+
+async def _ensure_unique_contact(db: AsyncSession, user_data: UserCreate) -> None:
+    """Reject registration if the email or phone is already taken, in one query."""
+    conditions = [User.email == user_data.email]
+    if user_data.phone:
+        conditions.append(User.phone == user_data.phone)
+    
+    result = await db.execute(select(User.email, User.phone).where(or_(*conditions)))
+    matches = result.all()
+    if any(email == user_data.email for email, _ in matches):
+        raise ConflictError("Email already registered")
+    if matches:
+        raise ConflictError("Phone number already registered")
+
+
+async def _flush_new_user(db: AsyncSession) -> None:
+    """Insert the user, mapping a unique violation from a concurrent signup to a conflict."""
+    try:
+        await db.flush()
+    except IntegrityError as e:
+        await db.rollback()
+        if "phone" in str(e.orig):
+            raise ConflictError("Phone number already registered")
+        raise ConflictError("Email already registered")
+
+
+async def _update_last_login(user_id: UUID, logged_in_at: datetime) -> None:
+    """Record a user's last login time outside the login request."""
+    try:
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                update(User).where(User.id == user_id).values(last_login=logged_in_at)
+            )
+            await session.commit()
+    except Exception as e:
+        logger.warning("Failed to update last login", user_id=str(user_id), error=str(e))
+
 
 @router.post("/register/customer", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
 async def register_customer(
@@ -36,28 +85,23 @@ async def register_customer(
     db: AsyncSession = Depends(get_db)
 ):
     """Register a new customer."""
-    # Check if email exists
-    result = await db.execute(select(User).where(User.email == user_data.email))
-    if result.scalar_one_or_none():
-        raise ConflictError("Email already registered")
+    # Check that email and phone are free
+    await _ensure_unique_contact(db, user_data)
     
-    # Check if phone exists
-    if user_data.phone:
-        result = await db.execute(select(User).where(User.phone == user_data.phone))
-        if result.scalar_one_or_none():
-            raise ConflictError("Phone number already registered")
+    # Hash off the event loop; bcrypt is deliberately slow
+    password_hash = await anyio.to_thread.run_sync(get_password_hash, user_data.password)
     
     # Create user
     user = User(
         email=user_data.email,
-        password_hash=get_password_hash(user_data.password),
+        password_hash=password_hash,
         phone=user_data.phone,
         role="customer",
         is_active=True,
         is_verified=False
     )
     db.add(user)
-    await db.flush()
+    await _flush_new_user(db)
     
     # Create customer profile
     profile = CustomerProfile(
@@ -95,28 +139,23 @@ async def register_provider(
     db: AsyncSession = Depends(get_db)
 ):
     """Register a new provider."""
-    # Check if email exists
-    result = await db.execute(select(User).where(User.email == user_data.email))
-    if result.scalar_one_or_none():
-        raise ConflictError("Email already registered")
+    # Check that email and phone are free
+    await _ensure_unique_contact(db, user_data)
     
-    # Check if phone exists
-    if user_data.phone:
-        result = await db.execute(select(User).where(User.phone == user_data.phone))
-        if result.scalar_one_or_none():
-            raise ConflictError("Phone number already registered")
+    # Hash off the event loop; bcrypt is deliberately slow
+    password_hash = await anyio.to_thread.run_sync(get_password_hash, user_data.password)
     
     # Create user
     user = User(
         email=user_data.email,
-        password_hash=get_password_hash(user_data.password),
+        password_hash=password_hash,
         phone=user_data.phone,
         role="provider",
         is_active=True,
         is_verified=False
     )
     db.add(user)
-    await db.flush()
+    await _flush_new_user(db)
     
     # Create provider profile
     from geoalchemy2 import WKTElement
@@ -157,22 +196,22 @@ async def register_provider(
 @router.post("/login", response_model=TokenResponse)
 async def login(
     credentials: UserLogin,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """Login user."""
     # Find user
-    result = await db.execute(select(User).where(User.email == credentials.email))
+    result = await db.execute(lambda_stmt(lambda: select(User).where(User.email == credentials.email)))
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(credentials.password, user.password_hash):
+    if not user or not await anyio.to_thread.run_sync(verify_password, credentials.password, user.password_hash):
         raise UnauthorizedError("Invalid email or password")
     
     if not user.is_active:
         raise UnauthorizedError("Account is inactive")
     
-    # Update last login
-    user.last_login = datetime.utcnow()
-    await db.commit()
+    # Update last login after the response is sent
+    background_tasks.add_task(_update_last_login, user.id, datetime.utcnow())
     
     # Generate tokens
     token_data = {"sub": str(user.id), "email": user.email, "role": user.role}
@@ -202,13 +241,17 @@ async def refresh_token(
     
     # Check if token is revoked
     jti = payload.get("jti")
+    if _revoked_refresh_jtis.get(jti):
+        raise UnauthorizedError("Refresh token revoked")
+    
     redis = await get_redis()
     if not await redis.exists(f"auth:refresh:{jti}"):
+        _revoked_refresh_jtis.set(jti, True)
         raise UnauthorizedError("Refresh token revoked")
     
     # Get user
     user_id = payload.get("sub")
-    result = await db.execute(select(User).where(User.id == user_id))
+    result = await db.execute(lambda_stmt(lambda: select(User).where(User.id == user_id)))
     user = result.scalar_one_or_none()
     
     if not user or not user.is_active:
@@ -220,8 +263,8 @@ async def refresh_token(
     refresh_token, refresh_jti = create_refresh_token(token_data_dict)
     
     # Revoke old refresh token and store new one
-    await redis.delete(f"auth:refresh:{jti}")
-    await redis.set(f"auth:refresh:{refresh_jti}", str(user.id), ex=604800)
+    await redis.replace(f"auth:refresh:{jti}", f"auth:refresh:{refresh_jti}", str(user.id), ex=604800)
+    _revoked_refresh_jtis.set(jti, True)
     
     return TokenResponse(
         access_token=access_token,
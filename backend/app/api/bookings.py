@@ -1,37 +1,128 @@
 """Booking endpoints."""
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from uuid import UUID
+from sqlalchemy import select, update, func, lambda_stmt
+from sqlalchemy.orm import joinedload
+from uuid import UUID, uuid4
 
 from app.core.security import get_current_user, require_customer, require_provider
 from app.core.exceptions import NotFoundError, BadRequestError
+from app.core.booking_cache import get_booking_cache
 from app.db.client import get_db
-from app.db.models import User, Booking as BookingModel, CustomerProfile, ProviderProfile, Service
+from app.db.models import (
+    User, Booking as BookingModel, CustomerProfile, ProviderProfile, Service, DEFAULT_BOOKING_DURATION_MINUTES
+)
 from app.domain.models import BookingRequest, Booking, BookingUpdate
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
-from app.services.matching import MatchingService
-from app.services.scheduling import SchedulingService
-from app.utils.notifications import create_notification
+from typing import Optional, Tuple, Dict, Any
+from app.services.matching import MatchingService, get_matching_service
+from app.services.scheduling import SchedulingService, get_scheduling_service
+from app.utils.notifications import send_notification, send_notifications
 
-router = APIRouter(prefix="/api/v1/bookings", tags=["bookings"])
+router = APIRouter(prefix="/api/v1/bookings", tags=["bookings"], default_response_class=ORJSONResponse)
 
-matching_service = MatchingService()
-scheduling_service = SchedulingService()
+# The Booking response nests both parties (with their users) and the service,
+# and notifications need the parties' user ids; load them with the booking
+# row instead of lazily one by one
+_BOOKING_RELATIONS = (
+    joinedload(BookingModel.customer).joinedload(CustomerProfile.user),
+    joinedload(BookingModel.provider).joinedload(ProviderProfile.user),
+    joinedload(BookingModel.service).joinedload(Service.category),
+)
+
+
+async def authorized_booking(
+    booking_id: UUID,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> BookingModel:
+    """
+    Dependency loading a booking the caller may access, in one query.
+    
+    The caller's customer and provider profile ids come back with the booking
+    and are left on request.state (customer_id, provider_id) for handlers
+    that need to know which party is acting.
+    """
+    user_id = current_user.id
+    result = await db.execute(lambda_stmt(
+        lambda: select(BookingModel, CustomerProfile.id, ProviderProfile.id)
+        # The caller's profiles join on the caller, not the booking, so name
+        # the booking as the left side explicitly
+        .select_from(BookingModel)
+        .outerjoin(CustomerProfile, CustomerProfile.user_id == user_id)
+        .outerjoin(ProviderProfile, ProviderProfile.user_id == user_id)
+        .options(*_BOOKING_RELATIONS)
+        .where(BookingModel.id == booking_id)
+    ))
+    row = result.first()
+    
+    if not row:
+        raise NotFoundError("Booking not found")
+    
+    booking, customer_id, provider_id = row
+    
+    # Only admins and the booking's own customer or provider may access it
+    if current_user.role != "admin":
+        is_customer = customer_id is not None and booking.customer_id == customer_id
+        is_provider = provider_id is not None and booking.provider_id == provider_id
+        if not (is_customer or is_provider):
+            raise NotFoundError("Booking not found")
+    
+    request.state.customer_id = customer_id
+    request.state.provider_id = provider_id
+    return booking
+
+
+async def _load_provider_booking(
+    db: AsyncSession,
+    booking_id: UUID,
+    user: User
+) -> Tuple[BookingModel, ProviderProfile]:
+    """Load a booking owned by the calling provider, with their profile, in one query."""
+    user_id = user.id
+    result = await db.execute(lambda_stmt(
+        lambda: select(BookingModel, ProviderProfile)
+        .join(ProviderProfile, ProviderProfile.id == BookingModel.provider_id)
+        .options(*_BOOKING_RELATIONS)
+        .where(
+            BookingModel.id == booking_id,
+            ProviderProfile.user_id == user_id
+        )
+    ))
+    row = result.first()
+    
+    if not row:
+        raise NotFoundError("Booking not found")
+    
+    return row[0], row[1]
+
+
+def _check_party_access(user: User, customer_user_id: str, provider_user_id: str):
+    """Raise NotFoundError unless the user is an admin or one of the booking's parties."""
+    if user.role != "admin" and str(user.id) not in (customer_user_id, provider_user_id):
+        raise NotFoundError("Booking not found")
 
 
 @router.post("/request", response_model=Booking, status_code=status.HTTP_201_CREATED)
 async def create_booking_request(
     request_data: BookingRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(require_customer),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    matching_service: MatchingService = Depends(get_matching_service)
 ):
     """Create a booking request."""
     # Get customer profile
+    user_id = current_user.id
     customer_result = await db.execute(
-        select(CustomerProfile).where(CustomerProfile.user_id == current_user.id)
+        lambda_stmt(
+            lambda: select(CustomerProfile)
+            .options(joinedload(CustomerProfile.user))
+            .where(CustomerProfile.user_id == user_id)
+        )
     )
     customer = customer_result.scalar_one_or_none()
     
@@ -39,10 +130,7 @@ async def create_booking_request(
         raise NotFoundError("Customer profile not found")
     
     # Get service
-    service_result = await db.execute(
-        select(Service).where(Service.id == request_data.service_id)
-    )
-    service = service_result.scalar_one_or_none()
+    service = await db.get(Service, request_data.service_id, options=[joinedload(Service.category)])
     
     if not service:
         raise NotFoundError("Service not found")
@@ -73,16 +161,14 @@ async def create_booking_request(
         match_reasoning = top_match["reasoning"]
     
     # Get provider
-    provider_result = await db.execute(
-        select(ProviderProfile).where(ProviderProfile.id == provider_id)
-    )
-    provider = provider_result.scalar_one_or_none()
+    provider = await db.get(ProviderProfile, provider_id, options=[joinedload(ProviderProfile.user)])
     
     if not provider:
         raise NotFoundError("Provider not found")
     
     # Create booking
     booking = BookingModel(
+        id=uuid4(),
         customer_id=customer.id,
         provider_id=provider_id,
         service_id=request_data.service_id,
@@ -97,12 +183,15 @@ async def create_booking_request(
         ai_match_score=match_score,
         ai_match_reasoning=match_reasoning
     )
+    # Attach the already loaded relations so the response needs no lazy loads
+    booking.customer = customer
+    booking.provider = provider
+    booking.service = service
     db.add(booking)
-    await db.flush()
     
-    # Notify provider
-    await create_notification(
-        db=db,
+    # Notify provider once the response is sent
+    background_tasks.add_task(
+        send_notification,
         user_id=provider.user_id,
         notification_type="booking_request",
         title="New Booking Request",
@@ -111,7 +200,6 @@ async def create_booking_request(
     )
     
     await db.commit()
-    await db.refresh(booking)
     
     return booking
 
@@ -123,71 +211,51 @@ async def get_booking(
     db: AsyncSession = Depends(get_db)
 ):
     """Get booking details."""
-    result = await db.execute(
-        select(BookingModel).where(BookingModel.id == booking_id)
-    )
-    booking = result.scalar_one_or_none()
+    booking_cache = get_booking_cache()
+    cached = await booking_cache.get(booking_id)
     
-    if not booking:
-        raise NotFoundError("Booking not found")
-    
-    # Check access
-    customer_result = await db.execute(
-        select(CustomerProfile).where(CustomerProfile.user_id == current_user.id)
-    )
-    customer = customer_result.scalar_one_or_none()
-    
-    provider_result = await db.execute(
-        select(ProviderProfile).where(ProviderProfile.user_id == current_user.id)
-    )
-    provider = provider_result.scalar_one_or_none()
+    if cached is None:
+        booking = await db.get(BookingModel, booking_id, options=list(_BOOKING_RELATIONS))
+        
+        if not booking:
+            raise NotFoundError("Booking not found")
+        
+        cached = Booking.model_validate(booking).model_dump(mode="json")
+        await booking_cache.set(booking_id, cached)
     
-    if current_user.role != "admin":
-        if customer and booking.customer_id != customer.id:
-            if not provider or booking.provider_id != provider.id:
-                raise NotFoundError("Booking not found")
+    # The cached entry is shared between users, so check access on every read
+    _check_party_access(current_user, cached["customer"]["user_id"], cached["provider"]["user_id"])
     
-    return booking
+    return ORJSONResponse(content=cached)
 
 
 @router.patch("/{booking_id}/accept", response_model=Booking)
 async def accept_booking(
     booking_id: UUID,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(require_provider),
     db: AsyncSession = Depends(get_db)
 ):
     """Provider accepts a booking request."""
-    # Get provider
-    provider_result = await db.execute(
-        select(ProviderProfile).where(ProviderProfile.user_id == current_user.id)
-    )
-    provider = provider_result.scalar_one_or_none()
-    
-    if not provider:
-        raise NotFoundError("Provider profile not found")
-    
-    # Get booking
-    result = await db.execute(
-        select(BookingModel).where(
-            BookingModel.id == booking_id,
-            BookingModel.provider_id == provider.id
-        )
-    )
-    booking = result.scalar_one_or_none()
-    
-    if not booking:
-        raise NotFoundError("Booking not found")
+    # Get booking with the caller's provider profile
+    booking, provider = await _load_provider_booking(db, booking_id, current_user)
     
     if booking.status != "requested":
         raise BadRequestError("Booking cannot be accepted in current status")
     
     booking.status = "accepted"
-    await db.commit()
-    await db.refresh(booking)
+    
+    # Count the acceptance towards the provider's completion rate
+    await db.execute(
+        update(ProviderProfile)
+        .where(ProviderProfile.id == booking.provider_id)
+        .values(accepted_bookings=ProviderProfile.accepted_bookings + 1)
+        .execution_options(synchronize_session=False)
+    )
     
     # Notify customer
-    await create_notification(
-        db=db,
+    background_tasks.add_task(
+        send_notification,
         user_id=booking.customer.user_id,
         notification_type="booking_accepted",
         title="Booking Accepted",
@@ -195,6 +263,9 @@ async def accept_booking(
         data={"booking_id": str(booking.id)}
     )
     
+    await db.commit()
+    await get_booking_cache().invalidate(booking.id)
+    
     return booking
 
 
@@ -202,30 +273,13 @@ async def accept_booking(
 async def reject_booking(
     booking_id: UUID,
     reason: str,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(require_provider),
     db: AsyncSession = Depends(get_db)
 ):
     """Provider rejects a booking request."""
-    # Get provider
-    provider_result = await db.execute(
-        select(ProviderProfile).where(ProviderProfile.user_id == current_user.id)
-    )
-    provider = provider_result.scalar_one_or_none()
-    
-    if not provider:
-        raise NotFoundError("Provider profile not found")
-    
-    # Get booking
-    result = await db.execute(
-        select(BookingModel).where(
-            BookingModel.id == booking_id,
-            BookingModel.provider_id == provider.id
-        )
-    )
-    booking = result.scalar_one_or_none()
-    
-    if not booking:
-        raise NotFoundError("Booking not found")
+    # Get booking with the caller's provider profile
+    booking, provider = await _load_provider_booking(db, booking_id, current_user)
     
     if booking.status != "requested":
         raise BadRequestError("Booking cannot be rejected in current status")
@@ -233,12 +287,10 @@ async def reject_booking(
     booking.status = "cancelled"
     booking.cancellation_reason = reason
     booking.cancelled_by = "provider"
-    await db.commit()
-    await db.refresh(booking)
     
     # Notify customer
-    await create_notification(
-        db=db,
+    background_tasks.add_task(
+        send_notification,
         user_id=booking.customer.user_id,
         notification_type="booking_cancelled",
         title="Booking Rejected",
@@ -246,85 +298,60 @@ async def reject_booking(
         data={"booking_id": str(booking.id)}
     )
     
+    await db.commit()
+    await get_booking_cache().invalidate(booking.id)
+    
     return booking
 
 
 @router.post("/{booking_id}/schedule", response_model=Booking)
 async def schedule_booking(
-    booking_id: UUID,
     scheduled_datetime: datetime,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    background_tasks: BackgroundTasks,
+    booking: BookingModel = Depends(authorized_booking),
+    db: AsyncSession = Depends(get_db),
+    scheduling_service: SchedulingService = Depends(get_scheduling_service)
 ):
     """Schedule a confirmed booking."""
-    # Get booking
-    result = await db.execute(
-        select(BookingModel).where(BookingModel.id == booking_id)
-    )
-    booking = result.scalar_one_or_none()
-    
-    if not booking:
-        raise NotFoundError("Booking not found")
-    
-    # Check access
-    customer_result = await db.execute(
-        select(CustomerProfile).where(CustomerProfile.user_id == current_user.id)
-    )
-    customer = customer_result.scalar_one_or_none()
-    
-    provider_result = await db.execute(
-        select(ProviderProfile).where(ProviderProfile.user_id == current_user.id)
-    )
-    provider = provider_result.scalar_one_or_none()
-    
-    if current_user.role != "admin":
-        if customer and booking.customer_id != customer.id:
-            if not provider or booking.provider_id != provider.id:
-                raise NotFoundError("Booking not found")
-    
     if booking.status != "accepted":
         raise BadRequestError("Booking must be accepted before scheduling")
     
-    # Use scheduling agent to validate time slot
-    slots = await scheduling_service.get_available_slots(
+    # Check the slot against the provider's bookings and time off
+    slot_available = await scheduling_service.is_slot_available(
         db=db,
-        provider_id=str(booking.provider_id),
-        preferred_date=scheduled_datetime.date(),
-        service_duration_minutes=booking.estimated_duration_minutes or 120,
-        booking_id=str(booking.id)
+        provider_id=booking.provider_id,
+        start=scheduled_datetime,
+        duration_minutes=booking.estimated_duration_minutes or DEFAULT_BOOKING_DURATION_MINUTES,
+        exclude_booking_id=booking.id
     )
-    
-    # Check if scheduled time is in available slots
-    scheduled_time_str = scheduled_datetime.isoformat()
-    available_times = [slot.get("start_datetime") for slot in slots.get("suggested_slots", [])]
-    
-    if available_times and scheduled_time_str not in available_times:
+    if not slot_available:
         raise BadRequestError("Selected time slot is not available")
     
     booking.status = "scheduled"
     booking.scheduled_datetime = scheduled_datetime
     
-    await db.commit()
-    await db.refresh(booking)
-    
-    # Notify both parties
-    await create_notification(
-        db=db,
-        user_id=booking.customer.user_id,
-        notification_type="booking_accepted",
-        title="Booking Scheduled",
-        message=f"Your booking has been scheduled for {scheduled_datetime.strftime('%Y-%m-%d %H:%M')}",
-        data={"booking_id": str(booking.id)}
-    )
+    # Notify both parties in one batched insert
+    scheduled_for = scheduled_datetime.strftime('%Y-%m-%d %H:%M')
+    data = {"booking_id": str(booking.id)}
+    background_tasks.add_task(send_notifications, [
+        {
+            "user_id": booking.customer.user_id,
+            "notification_type": "booking_accepted",
+            "title": "Booking Scheduled",
+            "message": f"Your booking has been scheduled for {scheduled_for}",
+            "data": data
+        },
+        {
+            "user_id": booking.provider.user_id,
+            "notification_type": "booking_accepted",
+            "title": "Booking Scheduled",
+            "message": f"You have a booking scheduled for {scheduled_for}",
+            "data": data
+        }
+    ])
     
-    await create_notification(
-        db=db,
-        user_id=booking.provider.user_id,
-        notification_type="booking_accepted",
-        title="Booking Scheduled",
-        message=f"You have a booking scheduled for {scheduled_datetime.strftime('%Y-%m-%d %H:%M')}",
-        data={"booking_id": str(booking.id)}
-    )
+    await db.commit()
+    await get_booking_cache().invalidate(booking.id)
     
     return booking
 
@@ -332,41 +359,22 @@ async def schedule_booking(
 @router.post("/{booking_id}/start", response_model=Booking)
 async def start_booking(
     booking_id: UUID,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(require_provider),
     db: AsyncSession = Depends(get_db)
 ):
     """Mark booking as in progress."""
-    # Get provider
-    provider_result = await db.execute(
-        select(ProviderProfile).where(ProviderProfile.user_id == current_user.id)
-    )
-    provider = provider_result.scalar_one_or_none()
-    
-    if not provider:
-        raise NotFoundError("Provider profile not found")
-    
-    # Get booking
-    result = await db.execute(
-        select(BookingModel).where(
-            BookingModel.id == booking_id,
-            BookingModel.provider_id == provider.id
-        )
-    )
-    booking = result.scalar_one_or_none()
-    
-    if not booking:
-        raise NotFoundError("Booking not found")
+    # Get booking with the caller's provider profile
+    booking, provider = await _load_provider_booking(db, booking_id, current_user)
     
     if booking.status != "scheduled":
         raise BadRequestError("Booking must be scheduled before starting")
     
     booking.status = "in_progress"
-    await db.commit()
-    await db.refresh(booking)
     
     # Notify customer
-    await create_notification(
-        db=db,
+    background_tasks.add_task(
+        send_notification,
         user_id=booking.customer.user_id,
         notification_type="system",
         title="Service Started",
@@ -374,37 +382,23 @@ async def start_booking(
         data={"booking_id": str(booking.id)}
     )
     
+    await db.commit()
+    await get_booking_cache().invalidate(booking.id)
+    
     return booking
 
 
 @router.post("/{booking_id}/complete", response_model=Booking)
 async def complete_booking(
     booking_id: UUID,
+    background_tasks: BackgroundTasks,
     final_price: Optional[Decimal] = None,
     current_user: User = Depends(require_provider),
     db: AsyncSession = Depends(get_db)
 ):
     """Mark booking as completed."""
-    # Get provider
-    provider_result = await db.execute(
-        select(ProviderProfile).where(ProviderProfile.user_id == current_user.id)
-    )
-    provider = provider_result.scalar_one_or_none()
-    
-    if not provider:
-        raise NotFoundError("Provider profile not found")
-    
-    # Get booking
-    result = await db.execute(
-        select(BookingModel).where(
-            BookingModel.id == booking_id,
-            BookingModel.provider_id == provider.id
-        )
-    )
-    booking = result.scalar_one_or_none()
-    
-    if not booking:
-        raise NotFoundError("Booking not found")
+    # Get booking with the caller's provider profile
+    booking, provider = await _load_provider_booking(db, booking_id, current_user)
     
     if booking.status != "in_progress":
         raise BadRequestError("Booking must be in progress before completing")
@@ -414,30 +408,27 @@ async def complete_booking(
     if final_price:
         booking.final_price = final_price
     
-    # Update provider stats
-    provider.total_bookings += 1
-    # Recalculate completion rate
-    completed_bookings = await db.execute(
-        select(func.count(BookingModel.id)).where(
-            BookingModel.provider_id == provider.id,
-            BookingModel.status == "completed"
+    # Update provider stats from the running counters in one atomic UPDATE,
+    # instead of recounting all of the provider's bookings
+    completed = ProviderProfile.completed_bookings + 1
+    await db.execute(
+        update(ProviderProfile)
+        .where(ProviderProfile.id == provider.id)
+        .values(
+            total_bookings=ProviderProfile.total_bookings + 1,
+            completed_bookings=completed,
+            # Keep the previous rate until acceptances have been counted
+            completion_rate=func.coalesce(
+                func.least(completed * 100.0 / func.nullif(ProviderProfile.accepted_bookings, 0), 100),
+                ProviderProfile.completion_rate
+            )
         )
+        .execution_options(synchronize_session="fetch")
     )
-    total_accepted = await db.execute(
-        select(func.count(BookingModel.id)).where(
-            BookingModel.provider_id == provider.id,
-            BookingModel.status.in_(["accepted", "scheduled", "in_progress", "completed"])
-        )
-    )
-    if total_accepted.scalar() > 0:
-        provider.completion_rate = (completed_bookings.scalar() / total_accepted.scalar()) * 100
-    
-    await db.commit()
-    await db.refresh(booking)
     
     # Notify customer
-    await create_notification(
-        db=db,
+    background_tasks.add_task(
+        send_notification,
         user_id=booking.customer.user_id,
         notification_type="booking_accepted",
         title="Service Completed",
@@ -445,43 +436,31 @@ async def complete_booking(
         data={"booking_id": str(booking.id)}
     )
     
+    await db.commit()
+    await get_booking_cache().invalidate(booking.id)
+    
     return booking
 
 
 @router.post("/{booking_id}/cancel", response_model=Booking)
 async def cancel_booking(
-    booking_id: UUID,
     reason: str,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    booking: BookingModel = Depends(authorized_booking),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Cancel a booking."""
-    # Get booking
-    result = await db.execute(
-        select(BookingModel).where(BookingModel.id == booking_id)
-    )
-    booking = result.scalar_one_or_none()
-    
-    if not booking:
-        raise NotFoundError("Booking not found")
-    
-    # Check access
-    customer_result = await db.execute(
-        select(CustomerProfile).where(CustomerProfile.user_id == current_user.id)
-    )
-    customer = customer_result.scalar_one_or_none()
-    
-    provider_result = await db.execute(
-        select(ProviderProfile).where(ProviderProfile.user_id == current_user.id)
-    )
-    provider = provider_result.scalar_one_or_none()
+    customer_id, provider_id = request.state.customer_id, request.state.provider_id
     
+    # Work out which party is cancelling
     cancelled_by_role = None
     if current_user.role == "admin":
         cancelled_by_role = "admin"
-    elif customer and booking.customer_id == customer.id:
+    elif customer_id and booking.customer_id == customer_id:
         cancelled_by_role = "customer"
-    elif provider and booking.provider_id == provider.id:
+    elif provider_id and booking.provider_id == provider_id:
         cancelled_by_role = "provider"
     else:
         raise NotFoundError("Booking not found")
@@ -489,18 +468,24 @@ async def cancel_booking(
     if booking.status in ["completed", "cancelled"]:
         raise BadRequestError(f"Booking cannot be cancelled in {booking.status} status")
     
+    # A cancelled acceptance no longer counts towards the completion rate
+    if booking.status in ["accepted", "scheduled", "in_progress"]:
+        await db.execute(
+            update(ProviderProfile)
+            .where(ProviderProfile.id == booking.provider_id)
+            .values(accepted_bookings=func.greatest(ProviderProfile.accepted_bookings - 1, 0))
+            .execution_options(synchronize_session=False)
+        )
+    
     booking.status = "cancelled"
     booking.cancellation_reason = reason
     booking.cancelled_by = cancelled_by_role
     booking.cancelled_at = datetime.utcnow()
     
-    await db.commit()
-    await db.refresh(booking)
-    
     # Notify the other party
     if cancelled_by_role == "customer":
-        await create_notification(
-            db=db,
+        background_tasks.add_task(
+            send_notification,
             user_id=booking.provider.user_id,
             notification_type="booking_cancelled",
             title="Booking Cancelled",
@@ -508,8 +493,8 @@ async def cancel_booking(
             data={"booking_id": str(booking.id)}
         )
     elif cancelled_by_role == "provider":
-        await create_notification(
-            db=db,
+        background_tasks.add_task(
+            send_notification,
             user_id=booking.customer.user_id,
             notification_type="booking_cancelled",
             title="Booking Cancelled",
@@ -517,6 +502,9 @@ async def cancel_booking(
             data={"booking_id": str(booking.id)}
         )
     
+    await db.commit()
+    await get_booking_cache().invalidate(booking.id)
+    
     return booking
 
 
@@ -527,29 +515,45 @@ async def get_booking_timeline(
     db: AsyncSession = Depends(get_db)
 ):
     """Get booking status timeline."""
-    result = await db.execute(
-        select(BookingModel).where(BookingModel.id == booking_id)
-    )
-    booking = result.scalar_one_or_none()
+    booking_cache = get_booking_cache()
+    cached = await booking_cache.get(booking_id, view="timeline")
     
-    if not booking:
-        raise NotFoundError("Booking not found")
+    if cached is None:
+        cached = await _build_booking_timeline(db, booking_id)
+        await booking_cache.set(booking_id, cached, view="timeline")
     
-    # Check access
-    customer_result = await db.execute(
-        select(CustomerProfile).where(CustomerProfile.user_id == current_user.id)
-    )
-    customer = customer_result.scalar_one_or_none()
+    # The cached entry is shared between users, so check access on every read
+    _check_party_access(current_user, cached["customer_user_id"], cached["provider_user_id"])
     
-    provider_result = await db.execute(
-        select(ProviderProfile).where(ProviderProfile.user_id == current_user.id)
-    )
-    provider = provider_result.scalar_one_or_none()
+    # Hand the timeline straight to orjson instead of walking it through
+    # jsonable_encoder first
+    return ORJSONResponse(content={"timeline": cached["timeline"]})
+
+
+async def _build_booking_timeline(db: AsyncSession, booking_id: UUID) -> Dict[str, Any]:
+    """Build a booking's timeline, with the parties' user ids for access checks."""
+    # Only the timeline columns, with the user ids of both parties
+    result = await db.execute(lambda_stmt(
+        lambda: select(
+            BookingModel.status,
+            BookingModel.created_at,
+            BookingModel.updated_at,
+            BookingModel.scheduled_datetime,
+            BookingModel.completed_at,
+            BookingModel.cancelled_at,
+            BookingModel.cancelled_by,
+            BookingModel.cancellation_reason,
+            CustomerProfile.user_id.label("customer_user_id"),
+            ProviderProfile.user_id.label("provider_user_id")
+        )
+        .join(CustomerProfile, CustomerProfile.id == BookingModel.customer_id)
+        .join(ProviderProfile, ProviderProfile.id == BookingModel.provider_id)
+        .where(BookingModel.id == booking_id)
+    ))
+    booking = result.one_or_none()
     
-    if current_user.role != "admin":
-        if customer and booking.customer_id != customer.id:
-            if not provider or booking.provider_id != provider.id:
-                raise NotFoundError("Booking not found")
+    if not booking:
+        raise NotFoundError("Booking not found")
     
     timeline = [
         {
@@ -594,5 +598,9 @@ async def get_booking_timeline(
             "notes": f"Cancelled by {booking.cancelled_by}: {booking.cancellation_reason}"
         })
     
-    return {"timeline": timeline}
+    return {
+        "customer_user_id": str(booking.customer_user_id),
+        "provider_user_id": str(booking.provider_user_id),
+        "timeline": timeline
+    }
 
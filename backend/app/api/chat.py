@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from uuid import UUID, uuid4
+from pydantic import TypeAdapter
 from typing import Optional, List
 from datetime import datetime
 
@@ -11,12 +12,12 @@ from app.core.exceptions import NotFoundError, BadRequestError
 from app.db.client import get_db
 from app.db.models import User, ChatConversation, ChatMessage as ChatMessageModel
 from app.domain.models import ChatMessageCreate, ChatMessage, ChatConversation as ChatConversationResponse, ChatResponse
-from app.agents.chat_agent import CustomerChatAgent, ProviderChatAgent
+from app.agents.chat_agent import get_customer_chat_agent, get_provider_chat_agent
 
 router = APIRouter(prefix="/api/v1/chat", tags=["chat"])
 
-customer_chat_agent = CustomerChatAgent()
-provider_chat_agent = ProviderChatAgent()
+# Validators for list responses, built once and run over whole result sets
+_messages_adapter = TypeAdapter(List[ChatMessage])
 
 
 @router.post("/message", response_model=ChatResponse, status_code=status.HTTP_200_OK)
@@ -70,9 +71,9 @@ async def send_chat_message(
     
     # Get appropriate chat agent
     if current_user.role == "customer":
-        chat_agent = customer_chat_agent
+        chat_agent = get_customer_chat_agent()
     else:
-        chat_agent = provider_chat_agent
+        chat_agent = get_provider_chat_agent()
     
     # Prepare context for the agent
     # Get user's recent bookings, profile info, etc. for context
@@ -186,7 +187,7 @@ async def get_conversations(
             is_active=conv.is_active,
             created_at=conv.created_at,
             updated_at=conv.updated_at,
-            messages=[ChatMessage.model_validate(msg) for msg in messages]
+            messages=_messages_adapter.validate_python(messages, from_attributes=True)
         ))
     
     return conversation_list
@@ -228,7 +229,7 @@ async def get_conversation(
         is_active=conversation.is_active,
         created_at=conversation.created_at,
         updated_at=conversation.updated_at,
-        messages=[ChatMessage.model_validate(msg) for msg in messages]
+        messages=_messages_adapter.validate_python(messages, from_attributes=True)
     )
 
 
@@ -2,6 +2,7 @@
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
+from pydantic import TypeAdapter
 from typing import List, Optional
 from uuid import UUID
 
@@ -19,6 +20,10 @@ from app.domain.models import (
 
 router = APIRouter(prefix="/api/v1/customers", tags=["customers"])
 
+# Validators for list responses, built once and run over whole result sets
+_bookings_adapter = TypeAdapter(List[Booking])
+_reviews_adapter = TypeAdapter(List[ReviewResponse])
+
 
 @router.get("/profile", response_model=CustomerProfileResponse)
 async def get_customer_profile(
@@ -105,7 +110,7 @@ async def get_customer_bookings(
     bookings = result.scalars().all()
     
     return PaginatedResponse.create(
-        items=[Booking.model_validate(b) for b in bookings],
+        items=_bookings_adapter.validate_python(bookings, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size
@@ -133,5 +138,5 @@ async def get_customer_reviews(
     )
     reviews = reviews_result.scalars().all()
     
-    return [ReviewResponse.model_validate(r) for r in reviews]
+    return _reviews_adapter.validate_python(reviews, from_attributes=True)
 
@@ -1,11 +1,12 @@
 """Dispute endpoints for users."""
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, func
 from uuid import UUID
 
 from app.core.security import get_current_user
 from app.core.exceptions import NotFoundError, BadRequestError
+from app.core.booking_cache import get_booking_cache
 from app.db.client import get_db
 from app.db.models import User, Booking as BookingModel, CustomerProfile, ProviderProfile, Dispute
 from app.domain.models import DisputeCreate
@@ -20,34 +21,27 @@ async def create_dispute(
     db: AsyncSession = Depends(get_db)
 ):
     """Create a dispute for a booking."""
-    # Get booking
+    # Get booking with both parties' user ids in one query
     result = await db.execute(
-        select(BookingModel).where(BookingModel.id == dispute_data.booking_id)
+        select(BookingModel, CustomerProfile.user_id, ProviderProfile.user_id)
+        .join(CustomerProfile, CustomerProfile.id == BookingModel.customer_id)
+        .join(ProviderProfile, ProviderProfile.id == BookingModel.provider_id)
+        .where(BookingModel.id == dispute_data.booking_id)
     )
-    booking = result.scalar_one_or_none()
+    row = result.first()
     
-    if not booking:
+    if not row:
         raise NotFoundError("Booking not found")
     
-    # Check if user is involved in the booking
-    customer_result = await db.execute(
-        select(CustomerProfile).where(CustomerProfile.user_id == current_user.id)
-    )
-    customer = customer_result.scalar_one_or_none()
-    
-    provider_result = await db.execute(
-        select(ProviderProfile).where(ProviderProfile.user_id == current_user.id)
-    )
-    provider = provider_result.scalar_one_or_none()
+    booking, customer_user_id, provider_user_id = row
     
-    if current_user.role != "admin":
-        if customer and booking.customer_id != customer.id:
-            if not provider or booking.provider_id != provider.id:
-                raise NotFoundError("Booking not found")
+    # Check if user is involved in the booking
+    if current_user.role != "admin" and current_user.id not in (customer_user_id, provider_user_id):
+        raise NotFoundError("Booking not found")
     
     # Check if dispute already exists
     existing_dispute = await db.execute(
-        select(Dispute).where(Dispute.booking_id == dispute_data.booking_id)
+        select(Dispute.id).where(Dispute.booking_id == dispute_data.booking_id)
     )
     if existing_dispute.scalar_one_or_none():
         raise BadRequestError("Dispute already exists for this booking")
@@ -56,36 +50,51 @@ async def create_dispute(
     dispute = Dispute(
         booking_id=dispute_data.booking_id,
         raised_by=current_user.id,
+        customer_user_id=customer_user_id,
+        provider_user_id=provider_user_id,
         dispute_type=dispute_data.dispute_type,
         description=dispute_data.description,
         evidence=dispute_data.evidence or []
     )
     db.add(dispute)
     
+    # Disputed bookings leave the provider's completion counters
+    if booking.status in ["accepted", "scheduled", "in_progress", "completed"]:
+        counters = {"accepted_bookings": func.greatest(ProviderProfile.accepted_bookings - 1, 0)}
+        if booking.status == "completed":
+            counters["completed_bookings"] = func.greatest(ProviderProfile.completed_bookings - 1, 0)
+        await db.execute(
+            update(ProviderProfile)
+            .where(ProviderProfile.id == booking.provider_id)
+            .values(**counters)
+            .execution_options(synchronize_session=False)
+        )
+    
     # Update booking status
     booking.status = "disputed"
     
     await db.commit()
     await db.refresh(dispute)
+    await get_booking_cache().invalidate(booking.id)
     
     # Notify the other party
     from app.utils.notifications import create_notification
     
-    if customer and booking.customer_id == customer.id:
+    if current_user.id == customer_user_id:
         # Customer raised dispute, notify provider
         await create_notification(
             db=db,
-            user_id=booking.provider.user_id,
+            user_id=provider_user_id,
             notification_type="system",
             title="Dispute Raised",
             message=f"A dispute has been raised for booking #{booking.id}",
             data={"dispute_id": str(dispute.id), "booking_id": str(booking.id)}
         )
-    elif provider and booking.provider_id == provider.id:
+    elif current_user.id == provider_user_id:
         # Provider raised dispute, notify customer
         await create_notification(
             db=db,
-            user_id=booking.customer.user_id,
+            user_id=customer_user_id,
             notification_type="system",
             title="Dispute Raised",
             message=f"A dispute has been raised for booking #{booking.id}",
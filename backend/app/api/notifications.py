@@ -2,6 +2,7 @@
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
+from pydantic import TypeAdapter
 from typing import List, Optional
 from uuid import UUID
 
@@ -13,6 +14,9 @@ from app.domain.models import Notification as NotificationResponse, PaginatedRes
 
 router = APIRouter(prefix="/api/v1/notifications", tags=["notifications"])
 
+# Validators for list responses, built once and run over whole result sets
+_notifications_adapter = TypeAdapter(List[NotificationResponse])
+
 
 @router.get("", response_model=PaginatedResponse)
 async def list_notifications(
@@ -40,7 +44,7 @@ async def list_notifications(
     notifications = result.scalars().all()
     
     return PaginatedResponse.create(
-        items=[NotificationResponse.model_validate(n) for n in notifications],
+        items=_notifications_adapter.validate_python(notifications, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size
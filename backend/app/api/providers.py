@@ -2,6 +2,7 @@
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
+from pydantic import TypeAdapter
 from typing import List, Optional
 from uuid import UUID
 
@@ -28,6 +29,12 @@ from app.domain.models import (
 
 router = APIRouter(prefix="/api/v1/providers", tags=["providers"])
 
+# Validators for list responses, built once and run over whole result sets
+_services_adapter = TypeAdapter(List[ServiceResponse])
+_bookings_adapter = TypeAdapter(List[Booking])
+_availability_adapter = TypeAdapter(List[ProviderAvailabilityResponse])
+_time_off_adapter = TypeAdapter(List[ProviderTimeOffResponse])
+
 
 @router.get("/profile", response_model=ProviderProfileResponse)
 async def get_provider_profile(
@@ -99,7 +106,7 @@ async def get_provider_services(
     )
     services = services_result.scalars().all()
     
-    return [ServiceResponse.model_validate(s) for s in services]
+    return _services_adapter.validate_python(services, from_attributes=True)
 
 
 @router.post("/services", response_model=ServiceResponse, status_code=status.HTTP_201_CREATED)
@@ -237,7 +244,7 @@ async def get_provider_bookings(
     bookings = result.scalars().all()
     
     return PaginatedResponse.create(
-        items=[Booking.model_validate(b) for b in bookings],
+        items=_bookings_adapter.validate_python(bookings, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size
@@ -263,7 +270,7 @@ async def get_availability(
     )
     availability = availability_result.scalars().all()
     
-    return [ProviderAvailabilityResponse.model_validate(a) for a in availability]
+    return _availability_adapter.validate_python(availability, from_attributes=True)
 
 
 @router.post("/availability", response_model=List[ProviderAvailabilityResponse], status_code=status.HTTP_201_CREATED)
@@ -306,7 +313,7 @@ async def set_availability(
     
     await db.commit()
     
-    return [ProviderAvailabilityResponse.model_validate(a) for a in new_availability]
+    return _availability_adapter.validate_python(new_availability, from_attributes=True)
 
 
 @router.get("/time-off", response_model=List[ProviderTimeOffResponse])
@@ -330,7 +337,7 @@ async def get_time_off(
     )
     time_off = time_off_result.scalars().all()
     
-    return [ProviderTimeOffResponse.model_validate(t) for t in time_off]
+    return _time_off_adapter.validate_python(time_off, from_attributes=True)
 
 
 @router.post("/time-off", response_model=ProviderTimeOffResponse, status_code=status.HTTP_201_CREATED)
@@ -9,13 +9,11 @@ from app.core.exceptions import NotFoundError, BadRequestError
 from app.db.client import get_db
 from app.db.models import User, Review, Booking as BookingModel, CustomerProfile, ProviderProfile
 from app.domain.models import ReviewCreate, ReviewUpdate, Review as ReviewResponse
-from app.agents.review_agent import ReviewAnalysisAgent
+from app.agents.review_agent import get_review_agent
 from app.utils.notifications import create_notification
 
 router = APIRouter(prefix="/api/v1/reviews", tags=["reviews"])
 
-review_agent = ReviewAnalysisAgent()
-
 
 @router.post("", response_model=ReviewResponse, status_code=status.HTTP_201_CREATED)
 async def create_review(
@@ -80,7 +78,7 @@ async def create_review(
         "execution_context": "review_analysis"
     }
     
-    agent_response = await review_agent.execute(
+    agent_response = await get_review_agent().execute(
         context=context,
         db=db,
         booking_id=str(booking.id)
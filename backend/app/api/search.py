@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_
 from sqlalchemy.sql import text
+from pydantic import TypeAdapter
 from typing import List, Optional
 from decimal import Decimal
 
@@ -21,12 +22,15 @@ from app.domain.models import (
     ServiceCategory as ServiceCategoryResponse,
     Service as ServiceResponse
 )
-from app.services.matching import MatchingService
 from app.services.recommendations import RecommendationService
 
 router = APIRouter(prefix="/api/v1/search", tags=["search"])
 
-matching_service = MatchingService()
+# Validators for list responses, built once and run over whole result sets
+_categories_adapter = TypeAdapter(List[ServiceCategoryResponse])
+_providers_adapter = TypeAdapter(List[ProviderProfileResponse])
+_services_adapter = TypeAdapter(List[ServiceResponse])
+
 recommendation_service = RecommendationService()
 
 
@@ -181,7 +185,7 @@ async def get_categories(
     )
     categories = result.scalars().all()
     
-    return [ServiceCategoryResponse.model_validate(c) for c in categories]
+    return _categories_adapter.validate_python(categories, from_attributes=True)
 
 
 @router.get("/recommendations", response_model=List[ProviderProfileResponse])
@@ -230,7 +234,7 @@ async def get_recommendations(
         if r["provider_id"] in provider_dict
     ]
     
-    return [ProviderProfileResponse.model_validate(p) for p in sorted_providers]
+    return _providers_adapter.validate_python(sorted_providers, from_attributes=True)
 
 
 @router.get("/providers/{provider_id}", response_model=ProviderProfileResponse)
@@ -267,5 +271,5 @@ async def get_provider_services(
     )
     services = result.scalars().all()
     
-    return [ServiceResponse.model_validate(s) for s in services]
+    return _services_adapter.validate_python(services, from_attributes=True)
 
@@ -0,0 +1,4 @@
+"""Shared caching for admin analytics."""
+from .cache import AnalyticsCache, get_analytics_cache
+
+__all__ = ["AnalyticsCache", "get_analytics_cache"]
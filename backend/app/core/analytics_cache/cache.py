@@ -0,0 +1,81 @@
+"""Redis cache for admin analytics shared across workers."""
+import orjson
+import structlog
+from typing import Optional, Dict, Any, Awaitable, Callable
+from app.core.redis_client import get_redis
+
+logger = structlog.get_logger()
+
+
+class AnalyticsCache:
+    """
+    Cache for computed analytics figures.
+    
+    Entries are keyed under a generation counter; bumping the generation
+    invalidates every cached figure at once without scanning for keys.
+    Redis errors never fail a request: reads fall through to computing the
+    figures and writes are skipped.
+    """
+    
+    GENERATION_KEY = "admin:analytics:generation"
+    
+    def __init__(self, ttl: int = 60):
+        self.ttl = ttl
+    
+    async def get_or_compute(
+        self,
+        name: str,
+        compute: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Get cached figures for name, computing and storing them on a miss.
+        
+        Args:
+            name: Identifies the figures, including any parameters
+            compute: Coroutine function producing the figures
+        
+        Returns:
+            The cached or freshly computed figures
+        """
+        cache_key = None
+        try:
+            redis = await get_redis()
+            generation = await redis.get(self.GENERATION_KEY) or "0"
+            cache_key = f"admin:analytics:{generation}:{name}"
+            cached = await redis.get(cache_key)
+            if cached:
+                return orjson.loads(cached)
+        except Exception as e:
+            logger.warning("Analytics cache read failed", name=name, error=str(e))
+        
+        result = await compute()
+        
+        # Stored under the generation read before computing, so figures that
+        # raced with an invalidation land in the old generation
+        if cache_key is not None:
+            try:
+                await redis.set(cache_key, orjson.dumps(result), ex=self.ttl)
+            except Exception as e:
+                logger.warning("Analytics cache write failed", name=name, error=str(e))
+        
+        return result
+    
+    async def invalidate(self):
+        """Invalidate all cached figures after a change that affects them."""
+        try:
+            redis = await get_redis()
+            await redis.incr(self.GENERATION_KEY)
+        except Exception as e:
+            logger.warning("Analytics cache invalidation failed", error=str(e))
+
+
+# Global analytics cache instance
+_analytics_cache: Optional[AnalyticsCache] = None
+
+
+def get_analytics_cache() -> AnalyticsCache:
+    """Get the global analytics cache."""
+    global _analytics_cache
+    if _analytics_cache is None:
+        _analytics_cache = AnalyticsCache()
+    return _analytics_cache
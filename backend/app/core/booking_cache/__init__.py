@@ -0,0 +1,4 @@
+"""Short-lived caching of booking reads."""
+from .cache import BookingCache, get_booking_cache
+
+__all__ = ["BookingCache", "get_booking_cache"]
@@ -0,0 +1,68 @@
+"""Redis cache for booking details and timelines shared across workers."""
+import orjson
+import structlog
+from typing import Optional, Dict, Any
+from uuid import UUID
+from app.core.redis_client import get_redis
+
+logger = structlog.get_logger()
+
+
+class BookingCache:
+    """
+    Cache for serialized booking responses.
+    
+    Customers and providers poll their bookings for status changes, so the
+    details and timeline of a booking are kept for a short TTL and dropped
+    on every state change. Entries are shared between users; callers must
+    still check access against the parties stored in the entry. Redis
+    errors never fail a request: reads miss and writes are skipped.
+    """
+    
+    def __init__(self, ttl: int = 30):
+        self.ttl = ttl
+    
+    @staticmethod
+    def _key(booking_id: UUID, view: str) -> str:
+        if view == "details":
+            return f"bk:{booking_id}"
+        return f"bk:{booking_id}:{view}"
+    
+    async def get(self, booking_id: UUID, view: str = "details") -> Optional[Dict[str, Any]]:
+        """Get a cached view of a booking, or None on a miss."""
+        try:
+            redis = await get_redis()
+            cached = await redis.get(self._key(booking_id, view))
+            if cached:
+                return orjson.loads(cached)
+        except Exception as e:
+            logger.warning("Booking cache read failed", booking_id=str(booking_id), error=str(e))
+        return None
+    
+    async def set(self, booking_id: UUID, entry: Dict[str, Any], view: str = "details"):
+        """Store a view of a booking; entry must be JSON serializable by orjson."""
+        try:
+            redis = await get_redis()
+            await redis.set(self._key(booking_id, view), orjson.dumps(entry), ex=self.ttl)
+        except Exception as e:
+            logger.warning("Booking cache write failed", booking_id=str(booking_id), error=str(e))
+    
+    async def invalidate(self, booking_id: UUID):
+        """Drop every cached view of a booking after it changes."""
+        try:
+            redis = await get_redis()
+            await redis.delete(self._key(booking_id, "details"), self._key(booking_id, "timeline"))
+        except Exception as e:
+            logger.warning("Booking cache invalidation failed", booking_id=str(booking_id), error=str(e))
+
+
+# Global booking cache instance
+_booking_cache: Optional[BookingCache] = None
+
+
+def get_booking_cache() -> BookingCache:
+    """Get the global booking cache."""
+    global _booking_cache
+    if _booking_cache is None:
+        _booking_cache = BookingCache()
+    return _booking_cache
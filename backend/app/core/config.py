@@ -14,16 +14,25 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Recycle connections before server-side idle timeouts drop them
     
     # JWT
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 10080  # 7 days
+    BCRYPT_ROUNDS: int = 12  # Password hashing work factor
     
     # OpenAI
     OPENAI_API_KEY: str
     OPENAI_MODEL: str = "gpt-4o-mini"
+    AI_BATCH_ENABLED: bool = False  # Coalesce concurrent stateless agent calls
+    OPENAI_EMBEDDING_MODEL: str = "text-embedding-3-small"
+    SEMANTIC_CACHE_ENABLED: bool = False
+    SEMANTIC_CACHE_THRESHOLD: float = 0.92  # Minimum cosine similarity for a hit
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
@@ -0,0 +1,4 @@
+"""In-process caching utilities."""
+from .cache import LocalTTLCache
+
+__all__ = ["LocalTTLCache"]
@@ -0,0 +1,42 @@
+"""Bounded in-process cache with per-entry expiry."""
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class LocalTTLCache:
+    """LRU cache for a single process whose entries expire after a fixed TTL."""
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Optional[Any]:
+        """Get a live value, refreshing its LRU position."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entries over capacity."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def delete(self, key: Hashable):
+        """Remove a value if present."""
+        self._data.pop(key, None)
+    
+    def clear(self):
+        """Remove all values."""
+        self._data.clear()
@@ -1,7 +1,7 @@
 """Parallel execution utilities."""
 from typing import List, Callable, Any, Dict, Optional
 import asyncio
-from datetime import datetime
+import time
 
 
 async def execute_parallel(
@@ -34,10 +34,10 @@ async def execute_parallel_with_timeout(
         coro = task_info["coro"]
         timeout = task_info.get("timeout", default_timeout)
         
-        start_time = datetime.utcnow()
+        start_time = time.monotonic()
         try:
             result = await asyncio.wait_for(coro, timeout=timeout)
-            execution_time = (datetime.utcnow() - start_time).total_seconds()
+            execution_time = time.monotonic() - start_time
             return {
                 "name": name,
                 "result": result,
@@ -46,7 +46,7 @@ async def execute_parallel_with_timeout(
                 "execution_time": execution_time
             }
         except asyncio.TimeoutError:
-            execution_time = (datetime.utcnow() - start_time).total_seconds()
+            execution_time = time.monotonic() - start_time
             return {
                 "name": name,
                 "result": None,
@@ -55,7 +55,7 @@ async def execute_parallel_with_timeout(
                 "execution_time": execution_time
             }
         except Exception as e:
-            execution_time = (datetime.utcnow() - start_time).total_seconds()
+            execution_time = time.monotonic() - start_time
             return {
                 "name": name,
                 "result": None,
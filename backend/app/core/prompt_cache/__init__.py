@@ -1,5 +1,5 @@
 """Prompt caching for AI agents."""
 from .cache import PromptCache, get_prompt_cache
+from .semantic import SemanticPromptCache, get_semantic_cache
 
-__all__ = ["PromptCache", "get_prompt_cache"]
-
+__all__ = ["PromptCache", "get_prompt_cache", "SemanticPromptCache", "get_semantic_cache"]
@@ -1,31 +1,49 @@
 """Prompt caching for AI agents to reduce API calls."""
 import hashlib
 import json
+import orjson
 from typing import Optional, Dict, Any
+from app.core.local_cache import LocalTTLCache
 from app.core.redis_client import get_redis
 
 
 class PromptCache:
     """Cache for AI agent prompts and responses."""
     
-    def __init__(self, ttl: int = 86400):  # 24 hours default
+    def __init__(self, ttl: int = 86400, local_ttl: float = 60.0):  # 24 hours default
         self.ttl = ttl
+        # Serialized responses for exact repeats within this process, checked before Redis
+        self._local = LocalTTLCache(maxsize=10_000, ttl=local_ttl)
     
     def _hash_prompt(self, agent_name: str, prompt: str, context: Dict[str, Any]) -> str:
-        """Generate hash for prompt and context."""
+        """
+        Generate hash for prompt and context.
+        
+        `prompt` may be the prompt text or a precomputed digest of it; callers
+        with large static prompts pass the digest so it is not rehashed per call.
+        """
         cache_key = f"{agent_name}:{prompt}:{json.dumps(context, sort_keys=True)}"
         return hashlib.sha256(cache_key.encode()).hexdigest()
     
     async def get(self, agent_name: str, prompt: str, context: Dict[str, Any]) -> Optional[Any]:
         """Get cached response."""
-        redis = await get_redis()
         cache_key = f"agent:prompt:{self._hash_prompt(agent_name, prompt, context)}"
-        return await redis.get_json(cache_key)
+        local = self._local.get(cache_key)
+        if local is not None:
+            # Decode a fresh copy so callers can mutate the response safely
+            return orjson.loads(local)
+        
+        redis = await get_redis()
+        response = await redis.get_json(cache_key)
+        if response is not None:
+            self._local.set(cache_key, orjson.dumps(response))
+        return response
     
     async def set(self, agent_name: str, prompt: str, context: Dict[str, Any], response: Any):
         """Cache response."""
-        redis = await get_redis()
         cache_key = f"agent:prompt:{self._hash_prompt(agent_name, prompt, context)}"
+        self._local.set(cache_key, orjson.dumps(response, default=str))
+        redis = await get_redis()
         await redis.set_json(cache_key, response, ex=self.ttl)
     
     async def invalidate(self, agent_name: str):
@@ -0,0 +1,90 @@
+"""Semantic prompt cache that matches paraphrased requests by embedding similarity."""
+import math
+from typing import Optional, Dict, Any, List
+from app.core.config import settings
+from app.core.redis_client import get_redis
+
+
+class SemanticPromptCache:
+    """Cache for AI agent responses keyed by prompt embeddings."""
+    
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        dimensions: int = 256,
+        max_entries: int = 100,
+        ttl: int = 86400  # 24 hours default
+    ):
+        self.threshold = threshold
+        self.dimensions = dimensions
+        self.max_entries = max_entries
+        self.ttl = ttl
+    
+    def _key(self, agent_name: str, scope: Optional[str]) -> str:
+        """Build the Redis key holding the entries for an agent and scope."""
+        return f"agent:semantic:{agent_name}:{scope or 'global'}"
+    
+    @staticmethod
+    def _normalize(embedding: List[float]) -> List[float]:
+        """Scale an embedding to unit length so cosine similarity is a dot product."""
+        norm = math.sqrt(sum(x * x for x in embedding)) or 1.0
+        return [round(x / norm, 5) for x in embedding]
+    
+    async def get(
+        self,
+        agent_name: str,
+        embedding: List[float],
+        scope: Optional[str] = None
+    ) -> Optional[Any]:
+        """
+        Get the cached response for the most similar stored prompt.
+        
+        Args:
+            agent_name: Agent the response belongs to
+            embedding: Embedding of the incoming prompt
+            scope: Optional owner (e.g. user ID) entries are isolated to
+        
+        Returns:
+            Cached response if the best match reaches the similarity threshold
+        """
+        redis = await get_redis()
+        entries: List[Dict[str, Any]] = await redis.get_json(self._key(agent_name, scope)) or []
+        if not entries:
+            return None
+        
+        query = self._normalize(embedding)
+        best_score, best_response = 0.0, None
+        for entry in entries:
+            score = sum(a * b for a, b in zip(query, entry["embedding"]))
+            if score > best_score:
+                best_score, best_response = score, entry["response"]
+        
+        if best_score >= self.threshold:
+            return best_response
+        return None
+    
+    async def set(
+        self,
+        agent_name: str,
+        embedding: List[float],
+        response: Any,
+        scope: Optional[str] = None
+    ):
+        """Cache response under a prompt embedding, keeping the most recent entries."""
+        redis = await get_redis()
+        cache_key = self._key(agent_name, scope)
+        entries = await redis.get_json(cache_key) or []
+        entries.insert(0, {"embedding": self._normalize(embedding), "response": response})
+        await redis.set_json(cache_key, entries[:self.max_entries], ex=self.ttl)
+
+
+# Global semantic cache instance
+_semantic_cache: Optional[SemanticPromptCache] = None
+
+
+def get_semantic_cache() -> SemanticPromptCache:
+    """Get the global semantic prompt cache."""
+    global _semantic_cache
+    if _semantic_cache is None:
+        _semantic_cache = SemanticPromptCache(threshold=settings.SEMANTIC_CACHE_THRESHOLD)
+    return _semantic_cache
@@ -44,11 +44,11 @@ class RedisClient:
             value = json.dumps(value)
         await self.client.set(key, value, ex=ex)
     
-    async def delete(self, key: str):
-        """Delete key from Redis."""
+    async def delete(self, *keys: str):
+        """Delete one or more keys from Redis."""
         if not self.client:
             await self.connect()
-        await self.client.delete(key)
+        await self.client.delete(*keys)
     
     async def exists(self, key: str) -> bool:
         """Check if key exists."""
@@ -56,6 +56,21 @@ class RedisClient:
             await self.connect()
         return bool(await self.client.exists(key))
     
+    async def replace(self, old_key: str, key: str, value: Any, ex: Optional[int] = None):
+        """Delete one key and set another in a single round-trip."""
+        if not self.client:
+            await self.connect()
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.delete(old_key)
+            pipe.set(key, value, ex=ex)
+            await pipe.execute()
+    
+    async def incr(self, key: str) -> int:
+        """Increment an integer value, starting from 0 if the key is missing."""
+        if not self.client:
+            await self.connect()
+        return await self.client.incr(key)
+    
     async def expire(self, key: str, seconds: int):
         """Set expiration on key."""
         if not self.client:
@@ -1,8 +1,8 @@
 """Retry logic with exponential backoff and circuit breaker."""
 import asyncio
+import time
 from typing import Callable, Any, Optional
 from enum import Enum
-from datetime import datetime, timedelta
 
 
 class CircuitState(Enum):
@@ -25,7 +25,7 @@ class CircuitBreaker:
         self.timeout = timeout
         self.expected_exception = expected_exception
         self.failure_count = 0
-        self.last_failure_time: Optional[datetime] = None
+        self.last_failure_time: Optional[float] = None  # time.monotonic() of last failure
         self.state = CircuitState.CLOSED
     
     def call(self, func: Callable, *args, **kwargs) -> Any:
@@ -69,7 +69,7 @@ class CircuitBreaker:
     def _on_failure(self):
         """Handle failed call."""
         self.failure_count += 1
-        self.last_failure_time = datetime.utcnow()
+        self.last_failure_time = time.monotonic()
         
         if self.failure_count >= self.failure_threshold:
             self.state = CircuitState.OPEN
@@ -79,7 +79,7 @@ class CircuitBreaker:
         if self.last_failure_time is None:
             return True
         
-        elapsed = (datetime.utcnow() - self.last_failure_time).total_seconds()
+        elapsed = time.monotonic() - self.last_failure_time
         return elapsed >= self.timeout
 
 
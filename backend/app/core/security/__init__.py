@@ -7,6 +7,7 @@ from .permissions import (
     require_provider,
     require_admin,
     require_provider_or_admin,
+    invalidate_admin_cache,
 )
 
 __all__ = [
@@ -21,5 +22,6 @@ __all__ = [
     "require_provider",
     "require_admin",
     "require_provider_or_admin",
+    "invalidate_admin_cache",
 ]
 
@@ -1,7 +1,9 @@
 """Optional dependencies for authentication."""
 from typing import Optional
-from fastapi import Security, HTTPException
+from fastapi import Depends, Security, HTTPException
 from fastapi.security import HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.client import get_db
 from app.db.models import User
 from .permissions import get_current_user
 
@@ -9,13 +11,15 @@ security = HTTPBearer(auto_error=False)
 
 
 async def get_optional_user(
-    credentials: Optional[HTTPBearer] = Security(security)
+    credentials: Optional[HTTPBearer] = Security(security),
+    db: AsyncSession = Depends(get_db)
 ) -> Optional[User]:
     """Get current user if authenticated, None otherwise."""
     if not credentials:
         return None
     try:
-        return await get_current_user(credentials=credentials)
-    except Exception:
+        return await get_current_user(credentials=credentials, db=db)
+    except HTTPException:
+        # Invalid token or inactive user; database errors still propagate
         return None
 
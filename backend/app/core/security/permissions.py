@@ -1,19 +1,32 @@
 """Permission decorators and dependencies for role-based access control."""
-from typing import Optional
+from typing import Optional, Dict, Any
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+import structlog
 
 from app.core.config import settings
 from app.core.security.jwt import verify_token
 from app.core.exceptions import UnauthorizedError, ForbiddenError
+from app.core.local_cache import LocalTTLCache
+from app.core.redis_client import get_redis
 from app.db.client import get_db
 from app.db.models import User
-from sqlalchemy import select
+from sqlalchemy import select, inspect, lambda_stmt
 
+logger = structlog.get_logger()
 
 security = HTTPBearer()
 
+# Admin users resolved per access token (keyed by jti), so admin pages that
+# poll several endpoints skip the user lookup. Entries hold the user's column
+# values rather than an ORM instance, live at most a minute, and are keyed
+# under a generation kept in Redis so invalidating on one worker drops them
+# on every worker.
+_admin_cache = LocalTTLCache(maxsize=1024, ttl=60.0)
+ADMIN_CACHE_GENERATION_KEY = "auth:admin:generation"
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -26,6 +39,11 @@ async def get_current_user(
     if not payload:
         raise UnauthorizedError("Invalid or expired token")
     
+    return await _get_user_for_payload(payload, db)
+
+
+async def _get_user_for_payload(payload: Dict[str, Any], db: AsyncSession) -> User:
+    """Load the active user a verified token payload belongs to."""
     user_id = payload.get("sub")
     if not user_id:
         raise UnauthorizedError("Invalid token payload")
@@ -34,7 +52,7 @@ async def get_current_user(
     # For now, we'll skip this check but it should be implemented
     
     # Get user from database
-    result = await db.execute(select(User).where(User.id == user_id))
+    result = await db.execute(lambda_stmt(lambda: select(User).where(User.id == user_id)))
     user = result.scalar_one_or_none()
     
     if not user:
@@ -65,14 +83,59 @@ async def require_provider(
 
 
 async def require_admin(
-    current_user: User = Depends(get_current_user)
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
 ) -> User:
     """Require the user to be an admin."""
+    payload = verify_token(credentials.credentials, token_type="access")
+    
+    if not payload:
+        raise UnauthorizedError("Invalid or expired token")
+    
+    # Without a generation (no jti, or Redis unavailable) the cache is skipped
+    jti = payload.get("jti")
+    generation = await _admin_cache_generation() if jti else None
+    cache_key = (generation, jti) if generation is not None else None
+    
+    if cache_key:
+        values = _admin_cache.get(cache_key)
+        if values is not None:
+            # Attach a fresh instance to this request's session without a query
+            user = User(**values)
+            make_transient_to_detached(user)
+            return await db.merge(user, load=False)
+    
+    current_user = await _get_user_for_payload(payload, db)
     if current_user.role != "admin":
         raise ForbiddenError("Admin access required")
+    
+    if cache_key:
+        _admin_cache.set(cache_key, {
+            attr.key: getattr(current_user, attr.key) for attr in inspect(User).column_attrs
+        })
     return current_user
 
 
+async def _admin_cache_generation() -> Optional[str]:
+    """Get the current admin cache generation, or None if Redis is unavailable."""
+    try:
+        redis = await get_redis()
+        return await redis.get(ADMIN_CACHE_GENERATION_KEY) or "0"
+    except Exception as e:
+        logger.warning("Admin cache generation read failed", error=str(e))
+        return None
+
+
+async def invalidate_admin_cache():
+    """Drop cached admin users on every worker, e.g. after an account is suspended or changed."""
+    _admin_cache.clear()
+    try:
+        redis = await get_redis()
+        await redis.incr(ADMIN_CACHE_GENERATION_KEY)
+    except Exception as e:
+        logger.warning("Admin cache invalidation failed", error=str(e))
+
+
 async def require_provider_or_admin(
     current_user: User = Depends(get_current_user)
 ) -> User:
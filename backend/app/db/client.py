@@ -43,7 +43,12 @@ database_url = prepare_asyncpg_url(settings.DATABASE_URL)
 # Check if original URL had sslmode=require
 ssl_required = 'sslmode=require' in settings.DATABASE_URL.lower()
 
-connect_args = {}
+# Keep more server-side prepared statements per connection so hot queries
+# are parsed and planned once rather than on every call
+connect_args = {
+    "statement_cache_size": 1024,
+    "prepared_statement_cache_size": 256,
+}
 if ssl_required:
     # For asyncpg with Neon, SSL is required
     # asyncpg accepts ssl=True or an SSL context
@@ -54,10 +59,12 @@ if ssl_required:
 engine = create_async_engine(
     database_url,
     echo=settings.DEBUG,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
     pool_pre_ping=True,
-    connect_args=connect_args if connect_args else {},
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    connect_args=connect_args,
 )
 
 # Create session factory
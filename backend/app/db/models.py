@@ -4,7 +4,7 @@ from sqlalchemy import (
     ForeignKey, Enum as SQLEnum, ARRAY, JSON, Index
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 from geoalchemy2 import Geography
 from datetime import datetime
@@ -21,7 +21,7 @@ class User(Base):
     email = Column(String(255), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
     phone = Column(String(20), unique=True, index=True)
-    role = Column(SQLEnum("customer", "provider", "admin", name="user_role"), nullable=False, index=True)
+    role = Column(SQLEnum("customer", "provider", "admin", name="user_role"), nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     is_verified = Column(Boolean, default=False, nullable=False)
     verification_token = Column(String(255))
@@ -34,6 +34,15 @@ class User(Base):
     provider_profile = relationship("ProviderProfile", back_populates="user", uselist=False)
     notifications = relationship("Notification", back_populates="user")
     chat_conversations = relationship("ChatConversation", back_populates="user")
+    
+    __table_args__ = (
+        Index("idx_users_created_at_id", "created_at", "id"),
+        # Covers the per-role user counts so they can be answered from the index alone
+        Index("idx_users_role_id", "role", postgresql_include=["id"]),
+        # Trigram indexes for the admin substring search (requires pg_trgm)
+        Index("idx_users_email_trgm", "email", postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}),
+        Index("idx_users_phone_trgm", "phone", postgresql_using="gin", postgresql_ops={"phone": "gin_trgm_ops"}),
+    )
 
 
 class CustomerProfile(Base):
@@ -86,6 +95,10 @@ class ProviderProfile(Base):
     rating_average = Column(DECIMAL(3, 2), default=0.00, nullable=False)
     rating_count = Column(Integer, default=0, nullable=False)
     total_bookings = Column(Integer, default=0, nullable=False)
+    # Running counts behind completion_rate (completed / accepted and not
+    # cancelled or disputed), maintained on accept, cancel, dispute and complete
+    accepted_bookings = Column(Integer, default=0, server_default="0", nullable=False)
+    completed_bookings = Column(Integer, default=0, server_default="0", nullable=False)
     completion_rate = Column(DECIMAL(5, 2), default=0.00, nullable=False)
     response_time_minutes = Column(Integer)
     status = Column(
@@ -108,6 +121,8 @@ class ProviderProfile(Base):
     __table_args__ = (
         Index("idx_provider_profiles_location", "location", postgresql_using="gist"),
         Index("idx_provider_profiles_rating", "rating_average"),
+        # Pending approvals are a small slice of all providers
+        Index("idx_provider_profiles_pending", "created_at", postgresql_where=text("status = 'pending'")),
     )
 
 
@@ -157,13 +172,25 @@ class Service(Base):
     )
 
 
+# Duration assumed for bookings without an estimate
+DEFAULT_BOOKING_DURATION_MINUTES = 120
+
+
+def booking_slot_range(start, duration_minutes):
+    """Time range a booking occupies; matches the GiST index on bookings for && overlap checks."""
+    return func.tsrange(
+        start,
+        start + func.make_interval(0, 0, 0, 0, 0, func.coalesce(duration_minutes, DEFAULT_BOOKING_DURATION_MINUTES))
+    )
+
+
 class Booking(Base):
     """Service requests and bookings."""
     __tablename__ = "bookings"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     customer_id = Column(UUID(as_uuid=True), ForeignKey("customer_profiles.id"), nullable=False, index=True)
-    provider_id = Column(UUID(as_uuid=True), ForeignKey("provider_profiles.id"), nullable=False, index=True)
+    provider_id = Column(UUID(as_uuid=True), ForeignKey("provider_profiles.id"), nullable=False)
     service_id = Column(UUID(as_uuid=True), ForeignKey("services.id"), nullable=False, index=True)
     status = Column(
         SQLEnum(
@@ -205,6 +232,25 @@ class Booking(Base):
     service = relationship("Service", back_populates="bookings")
     review = relationship("Review", back_populates="booking", uselist=False)
     dispute = relationship("Dispute", back_populates="booking", uselist=False)
+    
+    # Fetch server-generated timestamps with RETURNING on insert and update
+    # so written bookings can be serialised without a refresh
+    __mapper_args__ = {"eager_defaults": True}
+    
+    __table_args__ = (
+        Index("idx_bookings_created_at_id", "created_at", "id"),
+        # Per-provider status filters and counts answered from the index alone;
+        # also serves plain provider_id lookups
+        Index("idx_bookings_provider_status", "provider_id", "status", postgresql_include=["id"]),
+        # Scheduled slot per provider for overlap checks (requires btree_gist)
+        Index(
+            "idx_bookings_provider_slot",
+            provider_id,
+            booking_slot_range(scheduled_datetime, estimated_duration_minutes),
+            postgresql_using="gist",
+            postgresql_where=scheduled_datetime.isnot(None)
+        ),
+    )
 
 
 class ProviderAvailability(Base):
@@ -276,6 +322,11 @@ class Review(Base):
     booking = relationship("Booking", back_populates="review")
     customer = relationship("CustomerProfile", back_populates="reviews")
     provider = relationship("ProviderProfile", back_populates="reviews")
+    
+    __table_args__ = (
+        # Flagged reviews awaiting moderation are a small slice of all reviews
+        Index("idx_reviews_flagged", "created_at", postgresql_where=text("is_flagged")),
+    )
 
 
 class Notification(Base):
@@ -326,6 +377,9 @@ class Dispute(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     booking_id = Column(UUID(as_uuid=True), ForeignKey("bookings.id"), nullable=False, index=True)
     raised_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    # Both parties' user ids, copied from the booking at creation for notifications
+    customer_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+    provider_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
     dispute_type = Column(
         SQLEnum("service_quality", "pricing", "no_show", "damage", "other", name="dispute_type"),
         nullable=False
@@ -348,6 +402,11 @@ class Dispute(Base):
     
     # Relationships
     booking = relationship("Booking", back_populates="dispute")
+    
+    __table_args__ = (
+        Index("idx_disputes_created_at_id", "created_at", "id"),
+        Index("idx_disputes_status_created_at", "status", "created_at"),
+    )
 
 
 class ChatConversation(Base):
@@ -466,21 +466,30 @@ class DisputeResolution(BaseModel):
 class PaginatedResponse(BaseModel):
     """Generic paginated response."""
     items: List[Any]
-    total: int
+    total: Optional[int]
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int]
+    next_cursor: Optional[str] = None
     
     @classmethod
-    def create(cls, items: List[Any], total: int, page: int, page_size: int):
-        """Create paginated response."""
-        total_pages = (total + page_size - 1) // page_size
+    def create(
+        cls,
+        items: List[Any],
+        total: Optional[int],
+        page: int,
+        page_size: int,
+        next_cursor: Optional[str] = None
+    ):
+        """Create paginated response. Cursor pages may leave total unset."""
+        total_pages = (total + page_size - 1) // page_size if total is not None else None
         return cls(
             items=items,
             total=total,
             page=page,
             page_size=page_size,
-            total_pages=total_pages
+            total_pages=total_pages,
+            next_cursor=next_cursor
         )
 
 
@@ -3,6 +3,7 @@ from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
+from sqlalchemy.exc import InterfaceError, OperationalError, TimeoutError as PoolTimeoutError
 import structlog
 import logging
 import sys
@@ -10,6 +11,7 @@ import sys
 from app.core.config import settings
 from app.core.redis_client import redis_client
 from app.core.exceptions import KarigarException
+from app.agents.base import start_log_flusher, stop_log_flusher, close_clients
 from app.api import auth
 
 # Configure structured logging
@@ -129,6 +131,9 @@ async def lifespan(app: FastAPI):
     else:
         logger.error("  ✗ JWT Secret Key: Not configured!")
     
+    # Persist agent execution logs in the background
+    start_log_flusher()
+    
     logger.info("=" * 60)
     logger.info("Server starting...")
     logger.info("=" * 60)
@@ -139,6 +144,10 @@ async def lifespan(app: FastAPI):
     logger.info("=" * 60)
     logger.info("Shutting down Karigar Backend API")
     logger.info("=" * 60)
+    await stop_log_flusher()
+    logger.info("  ✓ Agent execution logs flushed")
+    await close_clients()
+    logger.info("  ✓ Model clients closed")
     try:
         await redis_client.disconnect()
         logger.info("  ✓ Redis disconnected")
@@ -174,6 +183,19 @@ async def karigar_exception_handler(request: Request, exc: KarigarException):
     )
 
 
+@app.exception_handler(OperationalError)
+@app.exception_handler(InterfaceError)
+@app.exception_handler(PoolTimeoutError)
+async def database_unavailable_handler(request: Request, exc: Exception):
+    """Shed load with a retryable 503 when the database is unreachable or the pool is exhausted."""
+    logger.warning("Database unavailable", error_type=type(exc).__name__, path=request.url.path)
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Service temporarily unavailable"},
+        headers={"Retry-After": "5"}
+    )
+
+
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions."""
@@ -206,6 +228,28 @@ async def db_health_check():
         )
 
 
+@app.get("/health/db/pool")
+async def db_pool_status():
+    """Database connection pool usage, for spotting pool exhaustion."""
+    from app.db.client import engine
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "timeout_seconds": settings.DB_POOL_TIMEOUT
+    }
+
+
+@app.get("/health/agents/pricing")
+async def pricing_agent_stats():
+    """How often pricing requests were answered by the rule-based program instead of the model."""
+    from app.agents.pricing_agent import get_pricing_agent
+    return get_pricing_agent().get_program_stats()
+
+
 @app.get("/health/redis")
 async def redis_health_check():
     """Redis health check."""
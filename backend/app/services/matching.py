@@ -5,7 +5,7 @@ from sqlalchemy import select, func, and_
 from sqlalchemy.sql import text
 from decimal import Decimal
 
-from app.agents.matching_agent import MatchingAgent
+from app.agents.matching_agent import get_matching_agent
 from app.db.models import ProviderProfile, Service, ServiceCategory, Booking as BookingModel
 from app.utils.distance import haversine_distance
 from app.core.parallel import execute_parallel_with_timeout
@@ -15,7 +15,7 @@ class MatchingService:
     """Service for intelligent provider matching."""
     
     def __init__(self):
-        self.matching_agent = MatchingAgent()
+        self.matching_agent = get_matching_agent()
     
     async def find_matching_providers(
         self,
@@ -77,17 +77,23 @@ class MatchingService:
             }
         )
         
+        rows = result.all()
+        if not rows:
+            return []
+        
+        # Average completed-booking price for every candidate in one round trip
+        avg_price_result = await db.execute(
+            select(BookingModel.provider_id, func.avg(BookingModel.final_price))
+            .where(BookingModel.provider_id.in_([row.id for row in rows]))
+            .where(BookingModel.status == "completed")
+            .group_by(BookingModel.provider_id)
+        )
+        avg_prices = dict(avg_price_result.all())
+        
         providers_data = []
-        for row in result:
+        for row in rows:
             provider_id = row.id
-            
-            # Get provider's recent reviews summary
-            reviews_result = await db.execute(
-                select(func.avg(BookingModel.final_price))
-                .where(BookingModel.provider_id == provider_id)
-                .where(BookingModel.status == "completed")
-            )
-            avg_price = reviews_result.scalar() or service.base_price
+            avg_price = avg_prices.get(provider_id) or service.base_price
             
             # Build provider context
             provider_data = {
@@ -155,3 +161,14 @@ class MatchingService:
         
         return enriched_matches[:10]  # Return top 10 matches
 
+
+# Shared instance, created on first use; it holds no per-request state
+_matching_service: Optional[MatchingService] = None
+
+
+def get_matching_service() -> MatchingService:
+    """Dependency for getting the shared matching service."""
+    global _matching_service
+    if _matching_service is None:
+        _matching_service = MatchingService()
+    return _matching_service
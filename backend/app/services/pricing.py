@@ -4,7 +4,7 @@ from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
-from app.agents.pricing_agent import PricingAgent
+from app.agents.pricing_agent import get_pricing_agent
 from app.db.models import Service, ProviderProfile, Booking as BookingModel
 
 
@@ -12,7 +12,7 @@ class PricingService:
     """Service for dynamic pricing recommendations."""
     
     def __init__(self):
-        self.pricing_agent = PricingAgent()
+        self.pricing_agent = get_pricing_agent()
     
     async def get_pricing_recommendation(
         self,
@@ -3,15 +3,16 @@ from typing import List, Dict, Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
-from app.agents.recommendation_agent import RecommendationAgent
+from app.agents.recommendation_agent import get_recommendation_agent
 from app.db.models import CustomerProfile, Booking as BookingModel, ProviderProfile, Service
+from app.utils.distance import haversine_distance
 
 
 class RecommendationService:
     """Service for personalized provider recommendations."""
     
     def __init__(self):
-        self.recommendation_agent = RecommendationAgent()
+        self.recommendation_agent = get_recommendation_agent()
     
     async def get_recommendations(
         self,
@@ -118,6 +119,5 @@ class RecommendationService:
     
     def _calculate_distance(self, lat1: float, lng1: float, lat2: float, lng2: float) -> float:
         """Calculate distance between two points."""
-        from app.utils.distance import haversine_distance
         return haversine_distance(lat1, lng1, lat2, lng2)
 
@@ -2,17 +2,20 @@
 from typing import List, Dict, Any, Optional
 from datetime import datetime, date, time, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, and_, or_, exists, func
+from uuid import UUID
 
-from app.agents.scheduling_agent import SchedulingAgent
-from app.db.models import ProviderProfile, ProviderAvailability, ProviderTimeOff, Booking as BookingModel
+from app.agents.scheduling_agent import get_scheduling_agent
+from app.db.models import (
+    ProviderProfile, ProviderAvailability, ProviderTimeOff, Booking as BookingModel, booking_slot_range
+)
 
 
 class SchedulingService:
     """Service for optimal time slot suggestions."""
     
     def __init__(self):
-        self.scheduling_agent = SchedulingAgent()
+        self.scheduling_agent = get_scheduling_agent()
     
     async def get_available_slots(
         self,
@@ -97,6 +100,42 @@ class SchedulingService:
         
         return agent_response
     
+    async def is_slot_available(
+        self,
+        db: AsyncSession,
+        provider_id: UUID,
+        start: datetime,
+        duration_minutes: int,
+        exclude_booking_id: Optional[UUID] = None
+    ) -> bool:
+        """
+        Check that a provider is free for a time slot.
+        
+        A slot is free when it overlaps none of the provider's active bookings
+        and none of their time off. Both are checked with EXISTS in one query.
+        """
+        end = start + timedelta(minutes=duration_minutes)
+        
+        booking_filters = [
+            BookingModel.provider_id == provider_id,
+            BookingModel.status.in_(["accepted", "scheduled", "in_progress"]),
+            BookingModel.scheduled_datetime.isnot(None),
+            booking_slot_range(BookingModel.scheduled_datetime, BookingModel.estimated_duration_minutes)
+            .op("&&")(func.tsrange(start, end))
+        ]
+        if exclude_booking_id:
+            booking_filters.append(BookingModel.id != exclude_booking_id)
+        
+        booking_conflict = exists().where(*booking_filters)
+        time_off_conflict = exists().where(
+            ProviderTimeOff.provider_id == provider_id,
+            ProviderTimeOff.start_datetime < end,
+            ProviderTimeOff.end_datetime > start
+        )
+        
+        result = await db.execute(select(or_(booking_conflict, time_off_conflict)))
+        return not result.scalar()
+    
     def _calculate_available_slots(
         self,
         availability: List[ProviderAvailability],
@@ -164,3 +203,14 @@ class SchedulingService:
         
         return slots
 
+
+# Shared instance, created on first use; it holds no per-request state
+_scheduling_service: Optional[SchedulingService] = None
+
+
+def get_scheduling_service() -> SchedulingService:
+    """Dependency for getting the shared scheduling service."""
+    global _scheduling_service
+    if _scheduling_service is None:
+        _scheduling_service = SchedulingService()
+    return _scheduling_service
@@ -1,11 +1,15 @@
 """Notification utilities."""
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from uuid import UUID
+import structlog
 
+from app.db.client import AsyncSessionLocal
 from app.db.models import Notification, User
 
+logger = structlog.get_logger()
+
 
 async def create_notification(
     db: AsyncSession,
@@ -28,6 +32,70 @@ async def create_notification(
     return notification
 
 
+async def create_notifications_bulk(db: AsyncSession, notifications: List[Dict[str, Any]]) -> None:
+    """
+    Create several notifications with one batched INSERT.
+    
+    Args:
+        notifications: Dicts with the keyword arguments of create_notification
+            (user_id, notification_type, title, message and optional data)
+    """
+    if not notifications:
+        return
+    
+    await db.execute(
+        insert(Notification),
+        [
+            {
+                "user_id": n["user_id"],
+                "type": n["notification_type"],
+                "title": n["title"],
+                "message": n["message"],
+                "data": n.get("data") or {}
+            }
+            for n in notifications
+        ]
+    )
+
+
+async def send_notification(
+    user_id: UUID,
+    notification_type: str,
+    title: str,
+    message: str,
+    data: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    Create a notification on its own session.
+    
+    For use as a background task after the response is sent; failures are
+    logged rather than raised since nobody is waiting on the result.
+    """
+    try:
+        async with AsyncSessionLocal() as session:
+            await create_notification(
+                db=session,
+                user_id=user_id,
+                notification_type=notification_type,
+                title=title,
+                message=message,
+                data=data
+            )
+            await session.commit()
+    except Exception as e:
+        logger.warning("Failed to send notification", user_id=str(user_id), error=str(e))
+
+
+async def send_notifications(notifications: List[Dict[str, Any]]) -> None:
+    """Create several notifications in one batch on its own session, as a background task."""
+    try:
+        async with AsyncSessionLocal() as session:
+            await create_notifications_bulk(session, notifications)
+            await session.commit()
+    except Exception as e:
+        logger.warning("Failed to send notifications", count=len(notifications), error=str(e))
+
+
 async def get_unread_count(db: AsyncSession, user_id: UUID) -> int:
     """Get count of unread notifications for a user."""
     result = await db.execute(
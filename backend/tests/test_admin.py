@@ -0,0 +1,33 @@
+"""Tests for admin list pagination."""
+import base64
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import orjson
+import pytest
+
+from app.api.admin import _decode_cursor, _encode_cursor
+from app.core.exceptions import BadRequestError
+
+
+def _cursor_for(data) -> str:
+    return base64.urlsafe_b64encode(orjson.dumps(data)).decode()
+
+
+def test_cursor_round_trip():
+    row = SimpleNamespace(created_at=datetime(2025, 1, 2, 3, 4, 5), id=uuid4())
+    
+    assert _decode_cursor(_encode_cursor(row)) == (row.created_at, row.id)
+
+
+@pytest.mark.parametrize("cursor", [
+    _cursor_for({"created_at": "2025-01-02T03:04:05", "id": 1}),
+    _cursor_for({"created_at": 1, "id": str(uuid4())}),
+    _cursor_for({"created_at": "2025-01-02T03:04:05"}),
+    _cursor_for(["2025-01-02T03:04:05", str(uuid4())]),
+    "not-a-cursor",
+])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(BadRequestError):
+        _decode_cursor(cursor)
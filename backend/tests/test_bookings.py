@@ -0,0 +1,76 @@
+"""Tests for booking access checks."""
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.security import get_current_user
+from app.db.client import get_db
+from app.db.models import User, Booking as BookingModel
+
+
+@pytest.fixture
+def accepted_booking():
+    return BookingModel(
+        id=uuid4(),
+        customer_id=uuid4(),
+        provider_id=uuid4(),
+        service_id=uuid4(),
+        status="accepted"
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_overrides():
+    yield
+    app.dependency_overrides.clear()
+
+
+def _client_for(user: User, session) -> TestClient:
+    async def override_get_db():
+        yield session
+    
+    app.dependency_overrides[get_current_user] = lambda: user
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app)
+
+
+def _schedule(client: TestClient, booking: BookingModel):
+    return client.post(
+        f"/api/v1/bookings/{booking.id}/schedule",
+        params={"scheduled_datetime": "2030-01-01T10:00:00"}
+    )
+
+
+def test_access_query_joins_the_callers_profiles_to_the_booking(compiling_session, accepted_booking):
+    user = User(id=uuid4(), role="provider", is_active=True)
+    session = compiling_session((accepted_booking, None, uuid4()))
+    
+    _schedule(_client_for(user, session), accepted_booking)
+    
+    sql = session.statements[0]
+    assert "FROM bookings LEFT OUTER JOIN customer_profiles" in sql
+    assert "LEFT OUTER JOIN provider_profiles" in sql
+
+
+def test_unrelated_provider_cannot_schedule_booking(compiling_session, accepted_booking):
+    provider = User(id=uuid4(), role="provider", is_active=True)
+    # The caller has a provider profile of their own and no customer profile
+    session = compiling_session((accepted_booking, None, uuid4()))
+    
+    response = _schedule(_client_for(provider, session), accepted_booking)
+    
+    assert response.status_code == 404
+    assert accepted_booking.status == "accepted"
+    assert not session.committed
+
+
+def test_caller_without_profiles_cannot_schedule_booking(compiling_session, accepted_booking):
+    user = User(id=uuid4(), role="customer", is_active=True)
+    session = compiling_session((accepted_booking, None, None))
+    
+    response = _schedule(_client_for(user, session), accepted_booking)
+    
+    assert response.status_code == 404
+    assert not session.committed
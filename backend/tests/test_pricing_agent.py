@@ -0,0 +1,53 @@
+"""Tests for the rule-based pricing program."""
+from decimal import Decimal
+from uuid import uuid4
+
+from app.agents.pricing_agent import PricingAgent
+from app.db.models import Service, ProviderProfile
+from app.services.pricing import PricingService
+
+
+async def test_rule_based_context_is_priced_without_the_model():
+    agent = PricingAgent()
+    context = {
+        "base_price": 1000.0,
+        "market_average": 1200.0,
+        "rating": 4.5,
+        "execution_context": "pricing"
+    }
+    
+    # The program answers before the caches or the model are consulted
+    response = await agent.execute(context=context)
+    
+    # (1000 + 1200) / 2, scaled by the 4.5 rating
+    assert response["recommended_price"] == 1155.0
+    assert response["price_range"] == {"min": 924.0, "max": 1386.0}
+    assert agent.get_program_stats() == {"program_hits": 1, "program_misses": 0}
+
+
+async def test_service_context_goes_to_the_model(compiling_session, monkeypatch):
+    service = Service(id=uuid4(), category_id=uuid4(), base_price=Decimal("1000"), price_unit="fixed")
+    provider = ProviderProfile(id=uuid4(), rating_average=Decimal("4.5"), total_bookings=12)
+    session = compiling_session(service, provider, Decimal("1200"))
+    
+    agent = PricingAgent()
+    contexts = []
+    
+    async def execute(context, **kwargs):
+        contexts.append(context)
+        return {}
+    
+    monkeypatch.setattr(agent, "execute", execute)
+    pricing_service = PricingService()
+    pricing_service.pricing_agent = agent
+    
+    await pricing_service.get_pricing_recommendation(
+        db=session,
+        service_id=str(service.id),
+        provider_id=str(provider.id)
+    )
+    
+    # Experience and price unit are inputs the rules do not account for
+    assert agent._answer_without_llm(contexts[0]) is None
+    assert agent.get_program_stats() == {"program_hits": 0, "program_misses": 1}
+    assert "avg(bookings.final_price)" in session.statements[2]